@@ -1,8 +1,16 @@
+from firedust.utils.api import async_shutdown, configure, shutdown
 from firedust.utils.logging import configure_logger
 
 from . import types
 from .entrypoint import assistant, data
 
-__all__ = ["assistant", "types", "data"]
+__all__ = [
+    "assistant",
+    "types",
+    "data",
+    "configure",
+    "shutdown",
+    "async_shutdown",
+]
 
 configure_logger()
@@ -23,7 +23,7 @@ from typing import List
 
 from firedust.types.assistant import AssistantConfig
 from firedust.types.tools import Tool
-from firedust.utils.api import AsyncAPIClient, SyncAPIClient
+from firedust.utils.api import AsyncAPIClient, SyncAPIClient, dump_models, json_body
 from firedust.utils.errors import APIError
 
 __all__: List[str] = [
@@ -36,10 +36,12 @@ class Abilities:
     """Synchronous wrapper around *ability* management endpoints."""
 
     _PATH: str = "/assistant"  # unified PATCH endpoint
+    __slots__ = ("_config", "_api_client", "_base")
 
     def __init__(self, config: AssistantConfig, api_client: SyncAPIClient) -> None:
         self._config = config
         self._api_client = api_client
+        self._base = {"assistant": config.name}
 
     # ---------------------------------------------------------------------
     # Public helpers
@@ -52,15 +54,13 @@ class Abilities:
 
         response = self._api_client.patch(
             self._PATH,
-            data={
-                "assistant": self._config.name,
-                "abilities": [tool.model_dump() for tool in updated_abilities],
-            },
+            content=json_body(self._base, abilities=dump_models(updated_abilities)),
         )
         if not response.is_success:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to add ability '{ability.function.name}': {response.text}",
+                message=f"Failed to add ability '{ability.function.name}'",
+                response=response,
             )
         # Update local config
         self._config.abilities = updated_abilities
@@ -81,10 +81,7 @@ class Abilities:
 
         response = self._api_client.patch(
             self._PATH,
-            data={
-                "assistant": self._config.name,
-                "abilities": [tool.model_dump() for tool in new_list],
-            },
+            content=json_body(self._base, abilities=dump_models(new_list)),
         )
 
         if response.is_success:
@@ -92,7 +89,8 @@ class Abilities:
         else:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to update ability '{ability.function.name}': {response.text}",
+                message=f"Failed to update ability '{ability.function.name}'",
+                response=response,
             )
 
     def remove(self, ability_name: str) -> None:
@@ -105,10 +103,7 @@ class Abilities:
 
         response = self._api_client.patch(
             self._PATH,
-            data={
-                "assistant": self._config.name,
-                "abilities": [tool.model_dump() for tool in pruned_list],
-            },
+            content=json_body(self._base, abilities=dump_models(pruned_list)),
         )
 
         if response.is_success:
@@ -116,7 +111,8 @@ class Abilities:
         else:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to remove ability '{ability_name}': {response.text}",
+                message=f"Failed to remove ability '{ability_name}'",
+                response=response,
             )
 
 
@@ -124,10 +120,12 @@ class AsyncAbilities:
     """Asynchronous wrapper around *ability* management endpoints."""
 
     _PATH: str = "/assistant"  # unified PATCH endpoint
+    __slots__ = ("_config", "_api_client", "_base")
 
     def __init__(self, config: AssistantConfig, api_client: AsyncAPIClient) -> None:
         self._config = config
         self._api_client = api_client
+        self._base = {"assistant": config.name}
 
     # ------------------------------------------------------------------
     # Public helpers
@@ -138,10 +136,7 @@ class AsyncAbilities:
 
         response = await self._api_client.patch(
             self._PATH,
-            data={
-                "assistant": self._config.name,
-                "abilities": [tool.model_dump() for tool in updated_abilities],
-            },
+            content=json_body(self._base, abilities=dump_models(updated_abilities)),
         )
 
         if response.is_success:
@@ -149,7 +144,8 @@ class AsyncAbilities:
         else:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to add ability '{ability.function.name}': {response.text}",
+                message=f"Failed to add ability '{ability.function.name}'",
+                response=response,
             )
 
     async def update(self, ability: Tool) -> None:
@@ -166,10 +162,7 @@ class AsyncAbilities:
 
         response = await self._api_client.patch(
             self._PATH,
-            data={
-                "assistant": self._config.name,
-                "abilities": [tool.model_dump() for tool in new_list],
-            },
+            content=json_body(self._base, abilities=dump_models(new_list)),
         )
 
         if response.is_success:
@@ -177,7 +170,8 @@ class AsyncAbilities:
         else:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to update ability '{ability.function.name}': {response.text}",
+                message=f"Failed to update ability '{ability.function.name}'",
+                response=response,
             )
 
     async def remove(self, ability_name: str) -> None:
@@ -189,10 +183,7 @@ class AsyncAbilities:
 
         response = await self._api_client.patch(
             self._PATH,
-            data={
-                "assistant": self._config.name,
-                "abilities": [tool.model_dump() for tool in pruned_list],
-            },
+            content=json_body(self._base, abilities=dump_models(pruned_list)),
         )
 
         if response.is_success:
@@ -200,5 +191,6 @@ class AsyncAbilities:
         else:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to remove ability '{ability_name}': {response.text}",
+                message=f"Failed to remove ability '{ability_name}'",
+                response=response,
             )
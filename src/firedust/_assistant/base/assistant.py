@@ -11,7 +11,8 @@ print(response.message)
 ```
 """
 
-from typing import Optional
+from types import TracebackType
+from typing import Dict, Optional, Tuple, Type
 
 from firedust._assistant.abilities.base import Abilities, AsyncAbilities
 from firedust._assistant.chat.base import AsyncChat, Chat
@@ -20,11 +21,23 @@ from firedust._assistant.learning.base import AsyncLearning, Learning
 from firedust._assistant.memory.base import AsyncMemory, Memory
 from firedust.types import AssistantConfig
 from firedust.types.base import INFERENCE_MODEL
-from firedust.utils.api import AsyncAPIClient, SyncAPIClient
+from firedust.utils.api import (
+    AsyncAPIClient,
+    SyncAPIClient,
+    default_async_client,
+    default_sync_client,
+)
 from firedust.utils.errors import APIError, AssistantError
 from firedust.utils.logging import LOG
 
 
+def _changes(**fields: Optional[str]) -> Dict[str, str]:
+    """
+    Returns the fields of an update that were actually given.
+    """
+    return {field: value for field, value in fields.items() if value is not None}
+
+
 class Assistant:
     """
     The main class to interact with firedust AI assistants. The class doesn't support direct
@@ -57,15 +70,30 @@ class Assistant:
         _allow_instantiation (bool): A private attribute to discourage direct instantiation of the Assistant class.
     """
 
+    __slots__ = (
+        "_config",
+        "_api_client",
+        "_update",
+        "_interface",
+        "_learn",
+        "_chat",
+        "_memory",
+        "_abilities",
+        "_description",
+    )
+
     _config: AssistantConfig
     _api_client: SyncAPIClient
 
-    _update: "_Update"
-    _interface: Interface
-    _learn: Learning
-    _chat: Chat
-    _memory: Memory
-    _abilities: Abilities
+    _update: Optional["_Update"]
+    _interface: Optional[Interface]
+    _learn: Optional[Learning]
+    _chat: Optional[Chat]
+    _memory: Optional[Memory]
+    _abilities: Optional[Abilities]
+
+    # cached repr and str, keyed by the configuration fields they show
+    _description: Optional[Tuple[Tuple[str, str, str], str, str]]
 
     # assistant should be started with firedust.assistant.create or .load methods
     _allow_instantiation: bool = False
@@ -95,17 +123,16 @@ class Assistant:
 
         # configuration
         self._config = config
-        self._api_client = api_client or SyncAPIClient()
-
-        # management
-        self._update = _Update(self._config, self._api_client)
-        self._interface = Interface(self._config, self._api_client)
+        self._api_client = api_client or default_sync_client()
 
-        # essence
-        self._learn = Learning(self._config, self._api_client)
-        self._chat = Chat(self._config, self._api_client)
-        self._memory = Memory(self._config, self._api_client)
-        self._abilities = Abilities(self._config, self._api_client)
+        # components are built on first access, most sessions use only one or two
+        self._update = None
+        self._interface = None
+        self._learn = None
+        self._chat = None
+        self._memory = None
+        self._abilities = None
+        self._description = None
 
     def __setattr__(self, key: str, value: str) -> None:
         """
@@ -124,25 +151,71 @@ class Assistant:
         assistant.update.model("mistral/mistral-medium")
         ```
         """
-        if not key.startswith("_"):
+        if key[0] != "_":
             self._raise_setter_error(key)
         return super().__setattr__(key, value)
 
     def __repr__(self) -> str:
-        return (
-            "Assistant("
-            f"name={self.config.name!r}, "
-            f"instructions={self.config.instructions!r}, "
-            f"model={self.config.model!r}"
-            ")"
-        )
+        return self._describe()[0]
 
     def __str__(self) -> str:
-        return (
-            f"assistant: {self.config.name}, "
-            f"model: {self.config.model}, "
-            f"instructions: {self.config.instructions}"
-        )
+        return self._describe()[1]
+
+    def _describe(self) -> Tuple[str, str]:
+        """
+        Returns the repr and str of the assistant, rebuilt only when its configuration changes.
+        """
+        config = self.config
+        key = (config.name, config.instructions, config.model)
+        if self._description is None or self._description[0] != key:
+            self._description = (
+                key,
+                (
+                    "Assistant("
+                    f"name={config.name!r}, "
+                    f"instructions={config.instructions!r}, "
+                    f"model={config.model!r}"
+                    ")"
+                ),
+                (
+                    f"assistant: {config.name}, "
+                    f"model: {config.model}, "
+                    f"instructions: {config.instructions}"
+                ),
+            )
+        return self._description[1], self._description[2]
+
+    def __enter__(self) -> "Assistant":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the assistant's API client and release its connections. The memory, chat
+        and other components share it, so none of them can be used afterwards.
+
+        Assistants returned by firedust.assistant.load and .create share the
+        process-wide default client. For them close() and the `with` block release
+        nothing and the assistant keeps working. Use firedust.shutdown() to release
+        the default client's connections, it reconnects on the next call.
+
+        Example:
+        ```python
+        import firedust
+
+        assistant = firedust.assistant.load("ASSISTANT_NAME")
+        response = assistant.chat.message("Hello, how are you?")
+        firedust.shutdown()
+        ```
+        """
+        self._api_client.close()
 
     @property
     def config(self) -> AssistantConfig:
@@ -154,27 +227,39 @@ class Assistant:
 
     @property
     def update(self) -> "_Update":
+        if self._update is None:
+            self._update = _Update(self._config, self._api_client)
         return self._update
 
     @property
     def interface(self) -> Interface:
+        if self._interface is None:
+            self._interface = Interface(self._config, self._api_client)
         return self._interface
 
     @property
     def learn(self) -> Learning:
+        if self._learn is None:
+            self._learn = Learning(self._config, self._api_client)
         return self._learn
 
     @property
     def chat(self) -> Chat:
+        if self._chat is None:
+            self._chat = Chat(self._config, self._api_client)
         return self._chat
 
     @property
     def memory(self) -> Memory:
+        if self._memory is None:
+            self._memory = Memory(self._config, self._api_client)
         return self._memory
 
     @property
     def abilities(self) -> Abilities:
         """Manage the assistant's function-calling tools (abilities)."""
+        if self._abilities is None:
+            self._abilities = Abilities(self._config, self._api_client)
         return self._abilities
 
     @classmethod
@@ -252,9 +337,10 @@ class Assistant:
         if not response.is_success:
             raise APIError(
                 code=response.status_code,
-                message=f"An error occured while deleting the assistant {self.config.name}: {response.text}",
+                message=f"An error occured while deleting the assistant {self.config.name}",
+                response=response,
             )
-        LOG.info(f"Successfully deleted assistant {self.config.name}.")
+        LOG.info("Successfully deleted assistant %s.", self.config.name)
 
 
 class _Update:
@@ -275,40 +361,69 @@ class _Update:
     ```
     """
 
+    __slots__ = ("config", "api_client")
+
     def __init__(self, config: AssistantConfig, api_client: SyncAPIClient) -> None:
         self.config = config
         self.api_client = api_client
 
-    def instructions(self, instructions: str) -> None:
+    def fields(
+        self,
+        instructions: Optional[str] = None,
+        model: Optional[INFERENCE_MODEL] = None,
+    ) -> None:
         """
-        Updates the instructions of the assistant.
+        Updates several fields of the assistant with a single request.
 
         Example:
         ```python
         import firedust
 
         assistant = firedust.assistant.load("ASSISTANT_NAME")
-
-        new_instructions = "1. Protect the ring bearer. 2. Do not let the ring corrupt you."
-        assistant.update.instructions(new_instructions)
+        assistant.update.fields(
+            instructions="1. Protect the ring bearer. 2. Do not let the ring corrupt you.",
+            model="mistral/mistral-medium",
+        )
         ```
 
         Args:
-            instructions (str): The new instructions for the assistant.
+            instructions (str, optional): The new instructions for the assistant.
+            model (INFERENCE_MODEL, optional): The new inference model.
         """
+        changes = _changes(instructions=instructions, model=model)
+        if not changes:
+            return
         response = self.api_client.patch(
             "/assistant",
-            data={
-                "assistant": str(self.config.name),
-                "instructions": instructions,
-            },
+            data={"assistant": self.config.name, **changes},
         )
         if not response.is_success:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to update the instructions of the assistant {self.config.name}: {response.text}",
+                message=f"Failed to update the assistant {self.config.name}",
+                response=response,
             )
-        self.config.instructions = instructions
+        for field, value in changes.items():
+            setattr(self.config, field, value)
+
+    def instructions(self, instructions: str) -> None:
+        """
+        Updates the instructions of the assistant.
+
+        Example:
+        ```python
+        import firedust
+
+        assistant = firedust.assistant.load("ASSISTANT_NAME")
+
+        new_instructions = "1. Protect the ring bearer. 2. Do not let the ring corrupt you."
+        assistant.update.instructions(new_instructions)
+        ```
+
+        Args:
+            instructions (str): The new instructions for the assistant.
+        """
+        self.fields(instructions=instructions)
 
     def model(self, new_model: INFERENCE_MODEL) -> None:
         """
@@ -325,19 +440,7 @@ class _Update:
         Args:
             new_model (INFERENCE_MODEL): The new inference model.
         """
-        response = self.api_client.patch(
-            "/assistant",
-            data={
-                "assistant": str(self.config.name),
-                "model": new_model,
-            },
-        )
-        if not response.is_success:
-            raise APIError(
-                code=response.status_code,
-                message=f"Failed to update the inference configuration: {response.text}",
-            )
-        self.config.model = new_model
+        self.fields(model=new_model)
 
 
 class AsyncAssistant:
@@ -359,6 +462,22 @@ class AsyncAssistant:
     asyncio.run(main())
     ```
 
+    Independent calls on several assistants can run concurrently with asyncio.gather:
+    ```python
+    import firedust
+    import asyncio
+
+    async def main():
+        assistants = await asyncio.gather(
+            *(firedust.assistant.async_load(name) for name in ["SAM", "FRODO"])
+        )
+        await asyncio.gather(
+            *(assistant.update.model("mistral/mistral-medium") for assistant in assistants)
+        )
+
+    asyncio.run(main())
+    ```
+
     Attributes:
         config (AssistantConfig): The assistant configuration.
         api_client (AsyncAPIClient): The API client.
@@ -373,15 +492,30 @@ class AsyncAssistant:
         _allow_instantiation (bool): A private attribute to discourage direct instantiation of the AsyncAssistant class.
     """
 
+    __slots__ = (
+        "_config",
+        "_api_client",
+        "_update",
+        "_interface",
+        "_learn",
+        "_chat",
+        "_memory",
+        "_abilities",
+        "_description",
+    )
+
     _config: AssistantConfig
     _api_client: AsyncAPIClient
 
-    _update: "_AsyncUpdate"
-    _interface: AsyncInterface
-    _learn: AsyncLearning
-    _chat: AsyncChat
-    _memory: AsyncMemory
-    _abilities: AsyncAbilities
+    _update: Optional["_AsyncUpdate"]
+    _interface: Optional[AsyncInterface]
+    _learn: Optional[AsyncLearning]
+    _chat: Optional[AsyncChat]
+    _memory: Optional[AsyncMemory]
+    _abilities: Optional[AsyncAbilities]
+
+    # cached repr and str, keyed by the configuration fields they show
+    _description: Optional[Tuple[Tuple[str, str, str], str, str]]
 
     # assistant should be instantiated using the create and load classmethods
     _allow_instantiation: bool = False
@@ -414,17 +548,16 @@ class AsyncAssistant:
 
         # configuration
         self._config = config
-        self._api_client = api_client or AsyncAPIClient()
-
-        # management
-        self._update = _AsyncUpdate(self._config, self._api_client)
-        self._interface = AsyncInterface(self._config, self._api_client)
+        self._api_client = api_client or default_async_client()
 
-        # essence
-        self._learn = AsyncLearning(self._config, self._api_client)
-        self._chat = AsyncChat(self._config, self._api_client)
-        self._memory = AsyncMemory(self._config, self._api_client)
-        self._abilities = AsyncAbilities(self._config, self._api_client)
+        # components are built on first access, most sessions use only one or two
+        self._update = None
+        self._interface = None
+        self._learn = None
+        self._chat = None
+        self._memory = None
+        self._abilities = None
+        self._description = None
 
     def __setattr__(self, key: str, value: str) -> None:
         """
@@ -447,25 +580,76 @@ class AsyncAssistant:
         asyncio.run(main())
         ```
         """
-        if not key.startswith("_"):
+        if key[0] != "_":
             self._raise_setter_error(key)
         return super().__setattr__(key, value)
 
     def __repr__(self) -> str:
-        return (
-            "AsyncAssistant("
-            f"name={self.config.name!r}, "
-            f"instructions={self.config.instructions!r}, "
-            f"model={self.config.model!r}"
-            ")"
-        )
+        return self._describe()[0]
 
     def __str__(self) -> str:
-        return (
-            f"assistant: {self.config.name}, "
-            f"model: {self.config.model}, "
-            f"instructions: {self.config.instructions}"
-        )
+        return self._describe()[1]
+
+    def _describe(self) -> Tuple[str, str]:
+        """
+        Returns the repr and str of the assistant, rebuilt only when its configuration changes.
+        """
+        config = self.config
+        key = (config.name, config.instructions, config.model)
+        if self._description is None or self._description[0] != key:
+            self._description = (
+                key,
+                (
+                    "AsyncAssistant("
+                    f"name={config.name!r}, "
+                    f"instructions={config.instructions!r}, "
+                    f"model={config.model!r}"
+                    ")"
+                ),
+                (
+                    f"assistant: {config.name}, "
+                    f"model: {config.model}, "
+                    f"instructions: {config.instructions}"
+                ),
+            )
+        return self._description[1], self._description[2]
+
+    async def __aenter__(self) -> "AsyncAssistant":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the assistant's API client. The memory, chat and other components share
+        it, so none of them can be used afterwards.
+
+        Assistants returned by firedust.assistant.async_load and .async_create share
+        the process-wide default client. For them close() and the `async with` block
+        release nothing and the assistant keeps working. Use firedust.async_shutdown()
+        to release the event loop's connection pool, a new one is created on the next
+        call.
+
+        Example:
+        ```python
+        import firedust
+        import asyncio
+
+        async def main():
+            assistant = await firedust.assistant.async_load("ASSISTANT_NAME")
+            response = await assistant.chat.message("Hello, how are you?")
+            await firedust.async_shutdown()
+
+        asyncio.run(main())
+        ```
+        """
+        await self._api_client.close()
 
     @property
     def config(self) -> AssistantConfig:
@@ -477,27 +661,39 @@ class AsyncAssistant:
 
     @property
     def update(self) -> "_AsyncUpdate":
+        if self._update is None:
+            self._update = _AsyncUpdate(self._config, self._api_client)
         return self._update
 
     @property
     def interface(self) -> AsyncInterface:
+        if self._interface is None:
+            self._interface = AsyncInterface(self._config, self._api_client)
         return self._interface
 
     @property
     def learn(self) -> AsyncLearning:
+        if self._learn is None:
+            self._learn = AsyncLearning(self._config, self._api_client)
         return self._learn
 
     @property
     def chat(self) -> AsyncChat:
+        if self._chat is None:
+            self._chat = AsyncChat(self._config, self._api_client)
         return self._chat
 
     @property
     def memory(self) -> AsyncMemory:
+        if self._memory is None:
+            self._memory = AsyncMemory(self._config, self._api_client)
         return self._memory
 
     @property
     def abilities(self) -> AsyncAbilities:
         """Manage the assistant's function-calling tools (abilities), asynchronously."""
+        if self._abilities is None:
+            self._abilities = AsyncAbilities(self._config, self._api_client)
         return self._abilities
 
     @classmethod
@@ -588,9 +784,10 @@ class AsyncAssistant:
         if not response.is_success:
             raise APIError(
                 code=response.status_code,
-                message=f"An error occured while deleting the assistant {self.config.name}: {response.text}",
+                message=f"An error occured while deleting the assistant {self.config.name}",
+                response=response,
             )
-        LOG.info(f"Successfully deleted assistant {self.config.name}.")
+        LOG.info("Successfully deleted assistant %s.", self.config.name)
 
 
 class _AsyncUpdate:
@@ -615,13 +812,19 @@ class _AsyncUpdate:
     ```
     """
 
+    __slots__ = ("config", "api_client")
+
     def __init__(self, config: AssistantConfig, api_client: AsyncAPIClient) -> None:
         self.config = config
         self.api_client = api_client
 
-    async def instructions(self, instructions: str) -> None:
+    async def fields(
+        self,
+        instructions: Optional[str] = None,
+        model: Optional[INFERENCE_MODEL] = None,
+    ) -> None:
         """
-        Updates the instructions of the assistant.
+        Updates several fields of the assistant with a single request.
 
         Example:
         ```python
@@ -630,33 +833,56 @@ class _AsyncUpdate:
 
         async def main():
             assistant = await firedust.assistant.async_load("ASSISTANT_NAME")
-
-            new_instructions = "1. Protect the ring bearer. 2. Do not let the ring corrupt you."
-            await assistant.update.instructions(new_instructions)
+            await assistant.update.fields(
+                instructions="1. Protect the ring bearer. 2. Do not let the ring corrupt you.",
+                model="mistral/mistral-medium",
+            )
 
         asyncio.run(main())
         ```
 
         Args:
-            instructions (str): The new instructions of the assistant.
+            instructions (str, optional): The new instructions of the assistant.
+            model (INFERENCE_MODEL, optional): The new inference model.
         """
+        changes = _changes(instructions=instructions, model=model)
+        if not changes:
+            return
         response = await self.api_client.patch(
             "/assistant",
-            data={
-                "assistant": str(self.config.name),
-                "instructions": instructions,
-            },
+            data={"assistant": self.config.name, **changes},
         )
         if not response.is_success:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to update the instructions of the assistant {self.config.name}: {response.text}",
+                message=f"Failed to update the assistant {self.config.name}",
+                response=response,
             )
-        self.config = AssistantConfig(
-            name=self.config.name,
-            instructions=instructions,
-            model=self.config.model,
-        )
+        for field, value in changes.items():
+            setattr(self.config, field, value)
+
+    async def instructions(self, instructions: str) -> None:
+        """
+        Updates the instructions of the assistant.
+
+        Example:
+        ```python
+        import firedust
+        import asyncio
+
+        async def main():
+            assistant = await firedust.assistant.async_load("ASSISTANT_NAME")
+
+            new_instructions = "1. Protect the ring bearer. 2. Do not let the ring corrupt you."
+            await assistant.update.instructions(new_instructions)
+
+        asyncio.run(main())
+        ```
+
+        Args:
+            instructions (str): The new instructions of the assistant.
+        """
+        await self.fields(instructions=instructions)
 
     async def model(self, new_model: INFERENCE_MODEL) -> None:
         """
@@ -677,20 +903,4 @@ class _AsyncUpdate:
         Args:
             new_model (INFERENCE_MODEL): The new inference model.
         """
-        response = await self.api_client.patch(
-            "/assistant",
-            data={
-                "assistant": str(self.config.name),
-                "model": new_model,
-            },
-        )
-        if not response.is_success:
-            raise APIError(
-                code=response.status_code,
-                message=f"Failed to update the inference configuration: {response.text}",
-            )
-        self.config = AssistantConfig(
-            name=self.config.name,
-            instructions=self.config.instructions,
-            model=new_model,
-        )
+        await self.fields(model=new_model)
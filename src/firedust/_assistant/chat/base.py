@@ -1,15 +1,11 @@
-import json
+import asyncio
+import itertools
 import re
 from datetime import datetime
-from typing import (
-    AsyncIterable,
-    AsyncIterator,
-    Iterable,
-    Iterator,
-    List,
-    Optional,
-    Union,
-)
+from typing import AsyncIterator, Iterable, Iterator, List, Optional, Tuple, Union
+
+import httpx
+from pydantic import TypeAdapter, ValidationError
 
 from firedust.types import (
     AssistantConfig,
@@ -24,10 +20,22 @@ from firedust.types.chat import (
     ResponseFormat,
     UserMessage,
 )
-from firedust.utils.api import AsyncAPIClient, SyncAPIClient
+from firedust.utils.api import (
+    AsyncAPIClient,
+    SyncAPIClient,
+    dump_models,
+    extract_data,
+    json_body,
+)
 from firedust.utils.errors import APIError
 from firedust.utils.inference_input_support import validate_message_content
 
+_MESSAGE_LIST_ADAPTER = TypeAdapter(List[Message])
+
+# server-sent events of the chat stream, compiled once instead of on every chunk
+_EVENT_SEPARATOR = re.compile(r"\n\ndata: ")
+_EVENT_PREFIX = "data: "
+
 
 class Chat:
     """
@@ -37,6 +45,7 @@ class Chat:
     def __init__(self, config: AssistantConfig, api_client: SyncAPIClient) -> None:
         self.config = config
         self.api_client = api_client
+        self._base = {"assistant": config.name}
         self._previous_stream_chunk = ""
 
     def stream(
@@ -122,7 +131,7 @@ class Chat:
         try:
             for msg in self.api_client.post_stream(
                 "/assistant/chat/stream",
-                data=chat_request.model_dump(),
+                content=chat_request.model_dump_json().encode(),
             ):
                 msg_decoded = msg.decode("utf-8")
                 for event in _process_stream_chunk(
@@ -226,14 +235,15 @@ class Chat:
 
         response = self.api_client.post(
             "/assistant/chat/message",
-            data=chat_request.model_dump(),
+            content=chat_request.model_dump_json().encode(),
         )
         if not response.is_success:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to send the message: {response.text}",
+                message="Failed to send the message",
+                response=response,
             )
-        return ReferencedMessage(**response.json()["data"])
+        return ReferencedMessage.model_validate(extract_data(response))
 
     def add_history(self, messages: Iterable[Message]) -> None:
         """
@@ -272,20 +282,23 @@ class Chat:
         Args:
             messages (Iterable[Message]): The chat messages.
         """
+        messages = list(messages)
+        if not messages:
+            return
+
         # Validate each message content first
         for msg in messages:
             validate_message_content(self.config.model, msg.content)
 
         response = self.api_client.put(
             "/assistant/chat/history",
-            data={
-                "messages": [msg.model_dump() for msg in messages],
-            },
+            content=json_body({}, messages=dump_models(messages)),
         )
         if not response.is_success:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to add chat history: {response.text}",
+                message="Failed to add chat history",
+                response=response,
             )
 
     def erase_history(self, chat_group: str, confirm: bool = False) -> None:
@@ -310,14 +323,15 @@ class Chat:
         response = self.api_client.delete(
             "/assistant/chat/history",
             params={
-                "assistant": self.config.name,
+                **self._base,
                 "chat_group": chat_group,
             },
         )
         if not response.is_success:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to erase chat history: {response.text}",
+                message="Failed to erase chat history",
+                response=response,
             )
 
     def get_history(
@@ -348,7 +362,7 @@ class Chat:
         response = self.api_client.get(
             "/assistant/chat/history",
             params={
-                "assistant": self.config.name,
+                **self._base,
                 "chat_group": chat_group,
                 "limit": limit,
                 "offset": offset,
@@ -357,10 +371,11 @@ class Chat:
         if not response.is_success:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to get chat history: {response.text}",
+                message="Failed to get chat history",
+                response=response,
             )
 
-        return [Message(**msg) for msg in response.json()["data"]]
+        return _MESSAGE_LIST_ADAPTER.validate_python(extract_data(response))
 
 
 class AsyncChat:
@@ -371,6 +386,7 @@ class AsyncChat:
     def __init__(self, config: AssistantConfig, api_client: AsyncAPIClient) -> None:
         self.config = config
         self.api_client = api_client
+        self._base = {"assistant": config.name}
         self._previous_stream_chunk = ""
 
     async def stream(
@@ -460,10 +476,10 @@ class AsyncChat:
         try:
             async for msg in self.api_client.post_stream(
                 "/assistant/chat/stream",
-                data=chat_request.model_dump(),
+                content=chat_request.model_dump_json().encode(),
             ):
                 msg_decoded = msg.decode("utf-8")
-                async for event in _async_process_stream_chunk(
+                for event in _process_stream_chunk(
                     msg_decoded, self._previous_stream_chunk
                 ):
                     yield event
@@ -567,21 +583,41 @@ class AsyncChat:
 
         response = await self.api_client.post(
             "/assistant/chat/message",
-            data=chat_request.model_dump(),
+            content=chat_request.model_dump_json().encode(),
         )
         if not response.is_success:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to send the message: {response.text}",
+                message="Failed to send the message",
+                response=response,
             )
 
-        return ReferencedMessage(**response.json()["data"])
+        return ReferencedMessage.model_validate(extract_data(response))
 
-    async def add_history(self, messages: Iterable[Message]) -> None:
+    async def add_history(
+        self,
+        messages: Iterable[Message],
+        chunk_size: int = 500,
+        max_concurrency: int = 8,
+    ) -> None:
         """
         Adds a chat message history to the assistant's memory, asynchronously. It helps the assistant
         learn from past conversations to improve the quality of responses.
 
+        Messages are read lazily and uploaded in chunks of `chunk_size`, with up to
+        `max_concurrency` chunks in flight, so large imports don't have to fit in memory.
+        Chunks are independent: if some fail, the others are still stored and an
+        APIError listing the failed chunks is raised at the end. Once a chunk is
+        rejected for its credentials (401, 403) no further chunks are sent, and once an
+        upload fails without a response, e.g. on a connection error, the uploads in
+        flight are cancelled and the error is raised.
+
+        Unlike `Chat.add_history`, which validates all messages before sending any,
+        each chunk is validated just before it is sent. A message with content the
+        model doesn't support raises a ValueError and stops the import, but the chunks
+        sent before it stay stored. Validate the messages upfront if the import must
+        be all-or-nothing.
+
         Example:
         ```python
         import firedust
@@ -616,21 +652,69 @@ class AsyncChat:
 
         Args:
             messages (Iterable[Message]): The chat messages.
+            chunk_size (int): The number of messages per request. Defaults to 500.
+            max_concurrency (int): The maximum number of requests in flight. Defaults to 8.
         """
-        # Validate each message content first
-        for msg in messages:
-            validate_message_content(self.config.model, msg.content)
-
-        response = await self.api_client.put(
-            "/assistant/chat/history",
-            data={
-                "messages": [msg.model_dump() for msg in messages],
-            },
-        )
-        if not response.is_success:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        failed: List[Tuple[int, httpx.Response]] = []
+        errors: List[Exception] = []
+        # Set once the remaining chunks can't succeed either, to stop reading the history
+        stopped = asyncio.Event()
+
+        async def upload(index: int, chunk: List[Message]) -> None:
+            try:
+                response = await self.api_client.put(
+                    "/assistant/chat/history",
+                    content=json_body({}, messages=dump_models(chunk)),
+                )
+            except Exception as e:
+                errors.append(e)
+                stopped.set()
+                raise
+            finally:
+                semaphore.release()
+            if not response.is_success:
+                failed.append((index, response))
+                if response.status_code in (401, 403):
+                    stopped.set()
+
+        uploads: List["asyncio.Task[None]"] = []
+        iterator = iter(messages)
+        try:
+            while not stopped.is_set():
+                chunk = list(itertools.islice(iterator, chunk_size))
+                if not chunk:
+                    break
+                # Validate each message content before its chunk is sent
+                for msg in chunk:
+                    validate_message_content(self.config.model, msg.content)
+                await semaphore.acquire()
+                if stopped.is_set():
+                    semaphore.release()
+                    break
+                uploads.append(asyncio.create_task(upload(len(uploads), chunk)))
+        finally:
+            if errors:
+                # The request failed without a response, the uploads in flight would too
+                for task in uploads:
+                    task.cancel()
+            # Let the uploads already in flight settle before reporting anything
+            await asyncio.gather(*uploads, return_exceptions=True)
+        if errors:
+            raise errors[0]
+
+        if failed:
+            failed.sort(key=lambda failure: failure[0])
+            details = "; ".join(
+                f"chunk {index}: {response.text}" for index, response in failed
+            )
+            unsent = (
+                ", the remaining messages were not sent" if stopped.is_set() else ""
+            )
             raise APIError(
-                code=response.status_code,
-                message=f"Failed to add chat history: {response.text}",
+                code=failed[0][1].status_code,
+                message=f"Failed to add chat history, {len(failed)} of {len(uploads)} "
+                f"chunks were rejected{unsent}: {details}",
             )
 
     async def erase_history(
@@ -663,14 +747,15 @@ class AsyncChat:
         response = await self.api_client.delete(
             "/assistant/chat/history",
             params={
-                "assistant": self.config.name,
+                **self._base,
                 "chat_group": chat_group,
             },
         )
         if not response.is_success:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to erase chat history: {response.text}",
+                message="Failed to erase chat history",
+                response=response,
             )
 
     async def get_history(
@@ -708,7 +793,7 @@ class AsyncChat:
         response = await self.api_client.get(
             "/assistant/chat/history",
             params={
-                "assistant": self.config.name,
+                **self._base,
                 "chat_group": chat_group,
                 "limit": limit,
                 "offset": offset,
@@ -717,10 +802,11 @@ class AsyncChat:
         if not response.is_success:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to get chat history: {response.text}",
+                message="Failed to get chat history",
+                response=response,
             )
 
-        return [Message(**msg) for msg in response.json()["data"]]
+        return _MESSAGE_LIST_ADAPTER.validate_python(extract_data(response))
 
 
 def _process_stream_chunk(
@@ -736,38 +822,19 @@ def _process_stream_chunk(
     Yields:
         MessageStreamEvent: The processed event from the data chunk.
     """
-    chunk_split = re.split(r"\n\ndata: ", chunk)
-    for data in chunk_split:
-        if previous_chunk:
-            data = previous_chunk + data
-            previous_chunk = ""
-        data = re.sub(r"^data: ", "", data).strip()
-        try:
-            yield MessageStreamEvent(**json.loads(data))
-        except json.JSONDecodeError:
-            previous_chunk = data
-
-
-async def _async_process_stream_chunk(
-    chunk: str, previous_chunk: str
-) -> AsyncIterable[MessageStreamEvent]:
-    """
-    Asynchronously process a chunk of streamed data and yield MessageStreamEvent objects.
-
-    Args:
-        chunk (str): The current chunk of data.
-        previous_chunk (str): The previous chunk of data, in case of incomplete data.
-
-    Yields:
-        MessageStreamEvent: The processed event from the data chunk.
-    """
-    chunk_split = re.split(r"\n\ndata: ", chunk)
-    for data in chunk_split:
+    for data in _EVENT_SEPARATOR.split(chunk):
         if previous_chunk:
             data = previous_chunk + data
             previous_chunk = ""
-        data = re.sub(r"^data: ", "", data).strip()
+        if data.startswith(_EVENT_PREFIX):
+            data = data[len(_EVENT_PREFIX) :]
+        data = data.strip()
         try:
-            yield MessageStreamEvent(**json.loads(data))
-        except json.JSONDecodeError:
+            # parses and validates the event in a single pass
+            event = MessageStreamEvent.model_validate_json(data)
+        except ValidationError as e:
+            if e.errors()[0]["type"] != "json_invalid":
+                raise
             previous_chunk = data
+            continue
+        yield event
@@ -2,7 +2,7 @@ import httpx
 
 from firedust.types import AssistantConfig
 from firedust.types.interface import SlackConfig, SlackTokens
-from firedust.utils.api import AsyncAPIClient, SyncAPIClient
+from firedust.utils.api import AsyncAPIClient, SyncAPIClient, extract_data
 from firedust.utils.errors import SlackError
 
 
@@ -48,7 +48,9 @@ class SlackInterface:
         if not response.is_success:
             raise SlackError(f"Failed to create Slack app: {response.text}")
 
-        self.config.interfaces.slack = SlackConfig(**response.json()["data"])
+        self.config.interfaces.slack = SlackConfig.model_validate(
+            extract_data(response)
+        )
 
         return response
 
@@ -223,7 +225,9 @@ class AsyncSlackInterface:
         if not response.is_success:
             raise SlackError(f"Failed to create Slack app: {response.text}")
 
-        self.config.interfaces.slack = SlackConfig(**response.json()["data"])
+        self.config.interfaces.slack = SlackConfig.model_validate(
+            extract_data(response)
+        )
 
         return response
 
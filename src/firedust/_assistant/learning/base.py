@@ -2,10 +2,14 @@ from pathlib import Path
 from typing import List, Union
 from uuid import UUID
 
+from pydantic import TypeAdapter
+
 from firedust.types import AssistantConfig
-from firedust.utils.api import AsyncAPIClient, SyncAPIClient
+from firedust.utils.api import AsyncAPIClient, SyncAPIClient, extract_data
 from firedust.utils.errors import APIError
 
+_UUID_LIST_ADAPTER = TypeAdapter(List[UUID])
+
 
 class Learning:
     """
@@ -17,6 +21,7 @@ class Learning:
     def __init__(self, config: AssistantConfig, api_client: SyncAPIClient) -> None:
         self.assistant = config
         self.api_client = api_client
+        self._base = {"assistant": config.name}
 
     def fast(self, text: str) -> List[UUID]:
         """
@@ -43,16 +48,16 @@ class Learning:
         """
         response = self.api_client.post(
             "/assistant/learn/fast",
-            data={"assistant": self.assistant.name, "text": text},
+            data={**self._base, "text": text},
         )
         if not response.is_success:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to teach the assistant: {response.text}",
+                message="Failed to teach the assistant",
+                response=response,
             )
 
-        memory_ids = [UUID(_id) for _id in response.json()["data"]]
-        return memory_ids
+        return _UUID_LIST_ADAPTER.validate_python(extract_data(response))
 
     def pdf(self, pdf: Union[str, Path]) -> None:
         """
@@ -137,6 +142,7 @@ class AsyncLearning:
     def __init__(self, assistant: AssistantConfig, api_client: AsyncAPIClient) -> None:
         self.assistant = assistant
         self.api_client = api_client
+        self._base = {"assistant": assistant.name}
 
     async def fast(self, text: str) -> List[UUID]:
         """
@@ -166,16 +172,16 @@ class AsyncLearning:
         """
         response = await self.api_client.post(
             "/assistant/learn/fast",
-            data={"assistant": self.assistant.name, "text": text},
+            data={**self._base, "text": text},
         )
         if not response.is_success:
             raise APIError(
                 code=response.status_code,
-                message=f"Failed to teach the assistant: {response.text}",
+                message="Failed to teach the assistant",
+                response=response,
             )
 
-        memory_ids = [UUID(_id) for _id in response.json()["data"]]
-        return memory_ids
+        return _UUID_LIST_ADAPTER.validate_python(extract_data(response))
 
     async def pdf(self, pdf: Union[str, Path]) -> None:
         """
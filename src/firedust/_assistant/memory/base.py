@@ -1,11 +1,82 @@
-from typing import List
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
 from uuid import UUID
 
+import httpx
+from pydantic import TypeAdapter
+
 import firedust
-from firedust.types import APIContent, AssistantConfig, MemoryItem
-from firedust.utils.api import AsyncAPIClient, SyncAPIClient
+from firedust._data import embed
+from firedust.types import AssistantConfig, MemoryItem
+from firedust.utils.api import (
+    AsyncAPIClient,
+    SyncAPIClient,
+    dump_models,
+    extract_data,
+    json_body,
+    route_missing,
+)
+from firedust.utils.cache import LRUCache, SemanticCache
 from firedust.utils.errors import APIError
 
+_RECALL_BATCH_ROUTE = "/assistant/memory/recall_batch"
+_ITEM_CACHE_SIZE = 2048
+# Items changed or deleted elsewhere are served from the cache for at most this long
+_ITEM_CACHE_TTL = 60.0
+
+# Validate whole response payloads in one pass instead of model by model
+_MEMORY_LIST_ADAPTER = TypeAdapter(List[MemoryItem])
+_MEMORY_BATCH_ADAPTER = TypeAdapter(Dict[int, List[MemoryItem]])
+_UUID_LIST_ADAPTER = TypeAdapter(List[UUID])
+
+
+def _check(response: httpx.Response, action: str) -> None:
+    """
+    Raise an APIError if the response is unsuccessful.
+
+    Args:
+        response (httpx.Response): The API response.
+        action (str): What failed, e.g. "recall memories".
+    """
+    if not response.is_success:
+        raise APIError(
+            code=response.status_code,
+            message=f"Failed to {action}",
+            response=response,
+        )
+
+
+def _remember(
+    cache: LRUCache[MemoryItem], memories: List[MemoryItem]
+) -> List[MemoryItem]:
+    """
+    Store copies of memory items in the item cache and return the items unchanged.
+    Callers own the returned items, changing them doesn't change the cache.
+    """
+    for memory in memories:
+        cache.set(memory.id, memory.model_copy())
+    return memories
+
+
+def _split_cached(
+    cache: Optional[LRUCache[MemoryItem]], memory_ids: List[UUID]
+) -> Tuple[Dict[UUID, MemoryItem], List[UUID]]:
+    """
+    Split memory IDs into the items found in the cache and the unique IDs that
+    still have to be fetched. Without a cache every ID has to be fetched. Cached
+    items are returned as copies.
+    """
+    found: Dict[UUID, MemoryItem] = {}
+    missing: List[UUID] = []
+    for memory_id in dict.fromkeys(memory_ids):
+        memory = None if cache is None else cache.get(memory_id)
+        if memory is None:
+            missing.append(memory_id)
+        else:
+            found[memory_id] = memory.model_copy()
+    return found, missing
+
 
 class Memory:
     """
@@ -15,8 +86,46 @@ class Memory:
     def __init__(self, config: AssistantConfig, api_client: SyncAPIClient) -> None:
         self.config = config
         self.api_client = api_client
+        self._base = {"assistant": config.name}
+        self._item_cache: LRUCache[MemoryItem] = LRUCache(
+            maxsize=_ITEM_CACHE_SIZE, ttl=_ITEM_CACHE_TTL
+        )
+        self._semantic_cache: Optional[SemanticCache[List[MemoryItem]]] = None
 
-    def recall(self, query: str, limit: int = 50, offset: int = 0) -> List[MemoryItem]:
+    def enable_semantic_cache(
+        self, threshold: float = 0.85, max_entries: int = 1024, ttl: float = 3600
+    ) -> None:
+        """
+        Cache recall results by query meaning.
+        Recalls of queries similar to a recent one are answered locally. The query is
+        embedded with `firedust.data.embed` through the assistant's API client, and when its cosine similarity with a
+        cached query reaches `threshold`, the cached memories are returned without a
+        recall request. Every recall of a new query text therefore costs an extra
+        embedding request, and a lookup compares it with all cached queries (faster
+        with numpy installed), so keep `max_entries` small unless recall is slow.
+
+        The cache is only cleared when memories are added or deleted through this
+        object. Memories stored by `learn`, `chat.add_history` or another client are
+        not seen, cached recalls can be up to `ttl` seconds stale.
+
+        Example:
+        ```python
+        import firedust
+
+        assistant = firedust.assistant.load("ASSISTANT_NAME")
+        assistant.memory.enable_semantic_cache(threshold=0.9)
+        ```
+
+        Args:
+            threshold (float): The minimum cosine similarity for a cache hit. Defaults to 0.85.
+            max_entries (int): The maximum number of cached recalls. Defaults to 1024.
+            ttl (float): Seconds a cached recall stays valid. Defaults to 3600.
+        """
+        self._semantic_cache = SemanticCache(threshold, max_entries, ttl)
+
+    def recall(
+        self, query: str, limit: int = 50, offset: int = 0, no_cache: bool = False
+    ) -> List[MemoryItem]:
         """
         Recall memories based on a query.
 
@@ -32,29 +141,94 @@ class Memory:
             query (str): The query to search memories for.
             limit (int): The maximum number of memories to return.
             offset (int): The offset to start from.
+            no_cache (bool): Skip the semantic cache, see `enable_semantic_cache`.
 
         Returns:
             List[MemoryItem]: The list of memories that are related to the query.
         """
+        cache = None if no_cache else self._semantic_cache
+        if cache is not None:
+            embedding = embed.text(query, api_client=self.api_client)
+            cached = cache.get(embedding, namespace=(limit, offset))
+            if cached is not None:
+                return [memory.model_copy() for memory in cached]
+
         response = self.api_client.post(
             "/assistant/memory/recall",
             data={
-                "assistant": self.config.name,
+                **self._base,
                 "query": query,
                 "limit": limit,
                 "offset": offset,
             },
+            idempotent=True,
         )
-        if not response.is_success:
-            raise APIError(
-                code=response.status_code,
-                message=f"Failed to recall memories: {response.text}",
+        _check(response, "recall memories")
+
+        memories = _remember(
+            self._item_cache,
+            _MEMORY_LIST_ADAPTER.validate_python(extract_data(response)),
+        )
+        if cache is not None:
+            cache.set(
+                embedding,
+                [memory.model_copy() for memory in memories],
+                namespace=(limit, offset),
             )
+        return memories
+
+    def recall_batch(
+        self, queries: List[str], limit: int = 50, offset: int = 0
+    ) -> Dict[int, List[MemoryItem]]:
+        """
+        Recall memories for several queries with a single request. If the API does not
+        support batched recalls, the queries are recalled one by one.
+
+        Example:
+        ```python
+        import firedust
 
-        content = APIContent(**response.json())
-        return [MemoryItem(**memory) for memory in content.data]
+        assistant = firedust.assistant.load("ASSISTANT_NAME")
+        results = assistant.memory.recall_batch(
+            ["Information about late deliveries.", "Refund requests."]
+        )
+        late_deliveries = results[0]
+        ```
 
-    def get(self, memory_ids: List[UUID]) -> List[MemoryItem]:
+        Args:
+            queries (List[str]): The queries to search memories for.
+            limit (int): The maximum number of memories to return per query.
+            offset (int): The offset to start from.
+
+        Returns:
+            Dict[int, List[MemoryItem]]: The recalled memories, keyed by the index of the query.
+        """
+        if _RECALL_BATCH_ROUTE not in self.api_client.unsupported_routes:
+            response = self.api_client.post(
+                _RECALL_BATCH_ROUTE,
+                data={
+                    **self._base,
+                    "queries": [
+                        {"query": query, "limit": limit, "offset": offset}
+                        for query in queries
+                    ],
+                },
+                idempotent=True,
+            )
+            if not route_missing(response):
+                _check(response, "recall memories")
+                batch = _MEMORY_BATCH_ADAPTER.validate_python(extract_data(response))
+                for memories in batch.values():
+                    _remember(self._item_cache, memories)
+                return batch
+            self.api_client.unsupported_routes.add(_RECALL_BATCH_ROUTE)
+
+        return {
+            index: self.recall(query, limit, offset)
+            for index, query in enumerate(queries)
+        }
+
+    def get(self, memory_ids: List[UUID], no_cache: bool = False) -> List[MemoryItem]:
         """
         Retrieve a list of memory items by their IDs.
 
@@ -70,32 +244,37 @@ class Memory:
         memories = assistant.memory.get(memory_ids)
         ```
 
+        Items returned in the last minute by `recall`, `get` or `add` are served from
+        a local cache, so changes made by other clients can take up to a minute to
+        show. Pass `no_cache=True` or call `invalidate` to fetch them again.
+
         Args:
             memory_ids (List[UUID]): A list of memory IDs.
+            no_cache (bool): Fetch every item from the API, skipping the local cache.
 
         Returns:
-            List[MemoryItem]: A list of memory items.
+            List[MemoryItem]: A list of memory items, in the order of the requested IDs.
         """
-        if len(memory_ids) == 0:
-            return []
-
-        response = self.api_client.post(
-            "/assistant/memory/list",
-            data={
-                "assistant": self.config.name,
-                "memory_ids": [str(memory_id) for memory_id in memory_ids],
-            },
-        )
-        if not response.is_success:
-            raise APIError(
-                code=response.status_code,
-                message=f"Failed to get memories: {response.text}",
+        cache = None if no_cache else self._item_cache
+        found, missing = _split_cached(cache, memory_ids)
+        if missing:
+            response = self.api_client.post(
+                "/assistant/memory/list",
+                data={
+                    **self._base,
+                    "memory_ids": missing,
+                },
+                idempotent=True,
             )
-        if response.status_code == 204:
-            return []
+            _check(response, "get memories")
+            if response.status_code != 204:
+                for item in _MEMORY_LIST_ADAPTER.validate_python(
+                    extract_data(response)
+                ):
+                    self._item_cache.set(item.id, item.model_copy())
+                    found[item.id] = item
 
-        content = APIContent(**response.json())
-        return [MemoryItem(**memory) for memory in content.data]
+        return [found[memory_id] for memory_id in memory_ids if memory_id in found]
 
     def add(self, memories: List[MemoryItem]) -> None:
         """
@@ -116,18 +295,17 @@ class Memory:
         Args:
             memories (List[MemoryItem]): The list of memory items to add.
         """
+        if not memories:
+            return
+
         response = self.api_client.put(
             "/assistant/memory/list",
-            data={
-                "assistant": self.config.name,
-                "memories": [memory.model_dump() for memory in memories],
-            },
+            content=json_body(self._base, memories=dump_models(memories)),
         )
-        if not response.is_success:
-            raise APIError(
-                code=response.status_code,
-                message=f"Failed to add memories: {response.text}",
-            )
+        _check(response, "add memories")
+        _remember(self._item_cache, memories)
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
 
     def delete(self, memory_ids: List[UUID]) -> None:
         """
@@ -146,18 +324,30 @@ class Memory:
         Args:
             memory_ids (List[UUID]): The list of memory IDs to remove.
         """
+        if not memory_ids:
+            return
+
         response = self.api_client.post(
             "/assistant/memory/delete",
             data={
-                "assistant": self.config.name,
-                "memory_ids": [str(memory_id) for memory_id in memory_ids],
+                **self._base,
+                "memory_ids": memory_ids,
             },
         )
-        if not response.is_success:
-            raise APIError(
-                code=response.status_code,
-                message=f"Failed to remove memory: {response.text}",
-            )
+        _check(response, "remove memory")
+        self.invalidate(memory_ids)
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
+
+    def invalidate(self, memory_ids: Iterable[UUID]) -> None:
+        """
+        Drop memory items from the local item cache, so the next `get` fetches them again.
+
+        Args:
+            memory_ids (Iterable[UUID]): The memory IDs to drop.
+        """
+        for memory_id in memory_ids:
+            self._item_cache.pop(memory_id)
 
     def list(self, limit: int = 100, offset: int = 0) -> List[UUID]:
         """
@@ -168,16 +358,47 @@ class Memory:
         """
         response = self.api_client.get(
             "/assistant/memory/list",
-            params={"assistant": self.config.name, "limit": limit, "offset": offset},
+            params={**self._base, "limit": limit, "offset": offset},
         )
-        if not response.is_success:
-            raise APIError(
-                code=response.status_code,
-                message=f"Failed to list memories: {response.text}",
-            )
+        _check(response, "list memories")
+
+        return _UUID_LIST_ADAPTER.validate_python(extract_data(response))
 
-        content = APIContent(**response.json())
-        return [UUID(memory_id) for memory_id in content.data]
+    def iter_all(self, page_size: int = 100) -> Iterator[UUID]:
+        """
+        Iterate over the IDs of all memory items available to the assistant. The next
+        page is fetched in the background while the current one is consumed.
+
+        Example:
+        ```python
+        import firedust
+
+        assistant = firedust.assistant.load("ASSISTANT_NAME")
+        for memory_id in assistant.memory.iter_all():
+            print(memory_id)
+        ```
+
+        Args:
+            page_size (int): The number of memory IDs to fetch per request.
+
+        Returns:
+            Iterator[UUID]: The memory IDs.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offset = 0
+            page = self.list(page_size, offset)
+            while page:
+                offset += page_size
+                next_page: "Optional[Future[List[UUID]]]" = None
+                if len(page) >= page_size:
+                    next_page = executor.submit(self.list, page_size, offset)
+                try:
+                    yield from page
+                except BaseException:
+                    if next_page is not None:
+                        next_page.cancel()
+                    raise
+                page = next_page.result() if next_page is not None else []
 
     def share(self, assistant_receiver: str) -> None:
         """
@@ -214,11 +435,7 @@ class Memory:
                 "assistant_receiver": assistant_receiver,
             },
         )
-        if not response.is_success:
-            raise APIError(
-                code=response.status_code,
-                message=f"Failed to share memories: {response.text}",
-            )
+        _check(response, "share memories")
 
     def unshare(self, assistant_receiver: str) -> None:
         """
@@ -251,11 +468,7 @@ class Memory:
                 "assistant_sharer": self.config.name,
             },
         )
-        if not response.is_success:
-            raise APIError(
-                code=response.status_code,
-                message=f"Failed to detach collection: {response.text}",
-            )
+        _check(response, "detach collection")
 
 
 class AsyncMemory:
@@ -266,9 +479,37 @@ class AsyncMemory:
     def __init__(self, config: AssistantConfig, api_client: AsyncAPIClient) -> None:
         self.config = config
         self.api_client = api_client
+        self._base = {"assistant": config.name}
+        self._item_cache: LRUCache[MemoryItem] = LRUCache(
+            maxsize=_ITEM_CACHE_SIZE, ttl=_ITEM_CACHE_TTL
+        )
+        self._semantic_cache: Optional[SemanticCache[List[MemoryItem]]] = None
+
+    def enable_semantic_cache(
+        self, threshold: float = 0.85, max_entries: int = 1024, ttl: float = 3600
+    ) -> None:
+        """
+        Cache recall results by query meaning.
+        Recalls of queries similar to a recent one are answered locally. The query is
+        embedded with `firedust.data.embed` through the assistant's API client, and when its cosine similarity with a
+        cached query reaches `threshold`, the cached memories are returned without a
+        recall request. Every recall of a new query text therefore costs an extra
+        embedding request, and a lookup compares it with all cached queries (faster
+        with numpy installed), so keep `max_entries` small unless recall is slow.
+
+        The cache is only cleared when memories are added or deleted through this
+        object. Memories stored by `learn`, `chat.add_history` or another client are
+        not seen, cached recalls can be up to `ttl` seconds stale.
+
+        Args:
+            threshold (float): The minimum cosine similarity for a cache hit. Defaults to 0.85.
+            max_entries (int): The maximum number of cached recalls. Defaults to 1024.
+            ttl (float): Seconds a cached recall stays valid. Defaults to 3600.
+        """
+        self._semantic_cache = SemanticCache(threshold, max_entries, ttl)
 
     async def recall(
-        self, query: str, limit: int = 50, offset: int = 0
+        self, query: str, limit: int = 50, offset: int = 0, no_cache: bool = False
     ) -> List[MemoryItem]:
         """
         Recall memories based on a query, asynchronously.
@@ -289,33 +530,133 @@ class AsyncMemory:
             query (str): The query to search memories for.
             limit (int): The maximum number of memories to return.
             offset (int): The offset to start from.
+            no_cache (bool): Skip the semantic cache, see `enable_semantic_cache`.
 
         Returns:
             List[MemoryItem]: The list of memories that are related to the query.
         """
+        cache = None if no_cache else self._semantic_cache
+        if cache is not None:
+            embedding = await embed.text_async(query, api_client=self.api_client)
+            cached = cache.get(embedding, namespace=(limit, offset))
+            if cached is not None:
+                return [memory.model_copy() for memory in cached]
+
         response = await self.api_client.post(
             "/assistant/memory/recall",
             data={
-                "assistant": self.config.name,
+                **self._base,
                 "query": query,
                 "limit": limit,
                 "offset": offset,
             },
+            idempotent=True,
         )
-        if not response.is_success:
-            raise APIError(
-                code=response.status_code,
-                message=f"Failed to recall memories: {response.text}",
+        _check(response, "recall memories")
+
+        memories = _remember(
+            self._item_cache,
+            _MEMORY_LIST_ADAPTER.validate_python(extract_data(response)),
+        )
+        if cache is not None:
+            cache.set(
+                embedding,
+                [memory.model_copy() for memory in memories],
+                namespace=(limit, offset),
+            )
+        return memories
+
+    async def recall_many(
+        self, queries: List[str], limit: int = 50, offset: int = 0
+    ) -> List[List[MemoryItem]]:
+        """
+        Recall memories for several queries concurrently. The requests are sent
+        together, so the total wait is close to the slowest single recall.
+
+        Example:
+        ```python
+        import firedust
+        import asyncio
+
+        async def main():
+            assistant = await firedust.assistant.async_load("ASSISTANT_NAME")
+            late, refunds = await assistant.memory.recall_many(
+                ["Information about late deliveries.", "Refund requests."]
             )
-        try:
-            content = APIContent(**response.json())
-        except Exception as e:
-            print(f"Failed to parse response: {response.text}")
-            raise e
 
-        return [MemoryItem(**memory) for memory in content.data]
+        asyncio.run(main())
+        ```
 
-    async def get(self, memory_ids: List[UUID]) -> List[MemoryItem]:
+        Args:
+            queries (List[str]): The queries to search memories for.
+            limit (int): The maximum number of memories to return per query.
+            offset (int): The offset to start from.
+
+        Returns:
+            List[List[MemoryItem]]: The recalled memories, in the order of the queries.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.recall(query, limit, offset) for query in queries)
+            )
+        )
+
+    async def recall_batch(
+        self, queries: List[str], limit: int = 50, offset: int = 0
+    ) -> Dict[int, List[MemoryItem]]:
+        """
+        Recall memories for several queries with a single request, asynchronously. If the
+        API does not support batched recalls, the queries are recalled concurrently.
+
+        Example:
+        ```python
+        import firedust
+        import asyncio
+
+        async def main():
+            assistant = await firedust.assistant.async_load("ASSISTANT_NAME")
+            results = await assistant.memory.recall_batch(
+                ["Information about late deliveries.", "Refund requests."]
+            )
+            late_deliveries = results[0]
+
+        asyncio.run(main())
+        ```
+
+        Args:
+            queries (List[str]): The queries to search memories for.
+            limit (int): The maximum number of memories to return per query.
+            offset (int): The offset to start from.
+
+        Returns:
+            Dict[int, List[MemoryItem]]: The recalled memories, keyed by the index of the query.
+        """
+        if _RECALL_BATCH_ROUTE not in self.api_client.unsupported_routes:
+            response = await self.api_client.post(
+                _RECALL_BATCH_ROUTE,
+                data={
+                    **self._base,
+                    "queries": [
+                        {"query": query, "limit": limit, "offset": offset}
+                        for query in queries
+                    ],
+                },
+                idempotent=True,
+            )
+            if not route_missing(response):
+                _check(response, "recall memories")
+                batch = _MEMORY_BATCH_ADAPTER.validate_python(extract_data(response))
+                for memories in batch.values():
+                    _remember(self._item_cache, memories)
+                return batch
+            self.api_client.unsupported_routes.add(_RECALL_BATCH_ROUTE)
+
+        results = await self.recall_many(queries, limit, offset)
+        return dict(enumerate(results))
+
+    async def get(
+        self, memory_ids: List[UUID], no_cache: bool = False
+    ) -> List[MemoryItem]:
         """
         Retrieve a list of memory items by their IDs, asynchronously. It is used for memory management.
 
@@ -335,27 +676,37 @@ class AsyncMemory:
         asyncio.run(main())
         ```
 
+        Items returned in the last minute by `recall`, `get` or `add` are served from
+        a local cache, so changes made by other clients can take up to a minute to
+        show. Pass `no_cache=True` or call `invalidate` to fetch them again.
+
         Args:
             memory_ids (List[UUID]): A list of memory IDs.
+            no_cache (bool): Fetch every item from the API, skipping the local cache.
 
         Returns:
-            List[MemoryItem]: A list of memory items.
+            List[MemoryItem]: A list of memory items, in the order of the requested IDs.
         """
-        response = await self.api_client.post(
-            "/assistant/memory/list",
-            data={
-                "assistant": self.config.name,
-                "memory_ids": [str(memory_id) for memory_id in memory_ids],
-            },
-        )
-        if not response.is_success:
-            raise APIError(
-                code=response.status_code,
-                message=f"Failed to get memories: {response.text}",
+        cache = None if no_cache else self._item_cache
+        found, missing = _split_cached(cache, memory_ids)
+        if missing:
+            response = await self.api_client.post(
+                "/assistant/memory/list",
+                data={
+                    **self._base,
+                    "memory_ids": missing,
+                },
+                idempotent=True,
             )
+            _check(response, "get memories")
+            if response.status_code != 204:
+                for item in _MEMORY_LIST_ADAPTER.validate_python(
+                    extract_data(response)
+                ):
+                    self._item_cache.set(item.id, item.model_copy())
+                    found[item.id] = item
 
-        content = APIContent(**response.json())
-        return [MemoryItem(**memory) for memory in content.data]
+        return [found[memory_id] for memory_id in memory_ids if memory_id in found]
 
     async def add(self, memories: List[MemoryItem]) -> None:
         """
@@ -380,18 +731,17 @@ class AsyncMemory:
         Args:
             memories (List[MemoryItem]): The list of memory items to add.
         """
+        if not memories:
+            return
+
         response = await self.api_client.put(
             "/assistant/memory/list",
-            data={
-                "assistant": self.config.name,
-                "memories": [memory.model_dump() for memory in memories],
-            },
+            content=json_body(self._base, memories=dump_models(memories)),
         )
-        if not response.is_success:
-            raise APIError(
-                code=response.status_code,
-                message=f"Failed to add memories: {response.text}",
-            )
+        _check(response, "add memories")
+        _remember(self._item_cache, memories)
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
 
     async def delete(self, memory_ids: List[UUID]) -> None:
         """
@@ -414,18 +764,30 @@ class AsyncMemory:
         Args:
             memory_ids (List[UUID]): The list of memory IDs to remove.
         """
+        if not memory_ids:
+            return
+
         response = await self.api_client.post(
             "/assistant/memory/delete",
             data={
-                "assistant": self.config.name,
-                "memory_ids": [str(memory_id) for memory_id in memory_ids],
+                **self._base,
+                "memory_ids": memory_ids,
             },
         )
-        if not response.is_success:
-            raise APIError(
-                code=response.status_code,
-                message=f"Failed to delete memories: {response.text}",
-            )
+        _check(response, "delete memories")
+        self.invalidate(memory_ids)
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
+
+    def invalidate(self, memory_ids: Iterable[UUID]) -> None:
+        """
+        Drop memory items from the local item cache, so the next `get` fetches them again.
+
+        Args:
+            memory_ids (Iterable[UUID]): The memory IDs to drop.
+        """
+        for memory_id in memory_ids:
+            self._item_cache.pop(memory_id)
 
     async def list(self, limit: int = 100, offset: int = 0) -> List[UUID]:
         """
@@ -436,17 +798,52 @@ class AsyncMemory:
         """
         response = await self.api_client.get(
             "/assistant/memory/list",
-            params={"assistant": self.config.name, "limit": limit, "offset": offset},
+            params={**self._base, "limit": limit, "offset": offset},
         )
 
-        if not response.is_success:
-            raise APIError(
-                code=response.status_code,
-                message=f"Failed to list memories: {response.text}",
-            )
+        _check(response, "list memories")
+
+        return _UUID_LIST_ADAPTER.validate_python(extract_data(response))
 
-        content = APIContent(**response.json())
-        return [UUID(memory_id) for memory_id in content.data]
+    async def iter_all(self, page_size: int = 100) -> AsyncIterator[UUID]:
+        """
+        Iterate over the IDs of all memory items available to the assistant, asynchronously.
+        The next page is fetched in the background while the current one is consumed.
+
+        Example:
+        ```python
+        import firedust
+        import asyncio
+
+        async def main():
+            assistant = await firedust.assistant.async_load("ASSISTANT_NAME")
+            async for memory_id in assistant.memory.iter_all():
+                print(memory_id)
+
+        asyncio.run(main())
+        ```
+
+        Args:
+            page_size (int): The number of memory IDs to fetch per request.
+
+        Returns:
+            AsyncIterator[UUID]: The memory IDs.
+        """
+        offset = 0
+        page = await self.list(page_size, offset)
+        while page:
+            offset += page_size
+            next_page: "Optional[asyncio.Task[List[UUID]]]" = None
+            if len(page) >= page_size:
+                next_page = asyncio.create_task(self.list(page_size, offset))
+            try:
+                for memory_id in page:
+                    yield memory_id
+            except BaseException:
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+            page = await next_page if next_page is not None else []
 
     async def share(self, assistant_receiver: str) -> None:
         """
@@ -485,11 +882,7 @@ class AsyncMemory:
                 "assistant_sharer": self.config.name,
             },
         )
-        if not response.is_success:
-            raise APIError(
-                code=response.status_code,
-                message=f"Failed to share memories: {response.text}",
-            )
+        _check(response, "share memories")
 
     async def unshare(self, assistant_receiver: str) -> None:
         """
@@ -526,8 +919,4 @@ class AsyncMemory:
                 "assistant_receiver": assistant_receiver,
             },
         )
-        if not response.is_success:
-            raise APIError(
-                code=response.status_code,
-                message=f"Failed to unshare collection: {response.text}",
-            )
+        _check(response, "unshare collection")
@@ -1,30 +1,269 @@
-from typing import List
+import asyncio
+from typing import Dict, List, Optional, Tuple
 
-from firedust.utils.api import SyncAPIClient
+import httpx
+
+from firedust.utils.api import (
+    AsyncAPIClient,
+    SyncAPIClient,
+    default_async_client,
+    default_sync_client,
+    extract_data,
+    route_missing,
+)
+from firedust.utils.batching import MicroBatcher
+from firedust.utils.cache import LRUCache, content_key
 from firedust.utils.errors import APIError
 
+_CACHE: LRUCache[List[float]] = LRUCache(maxsize=4096)
+_TEXT_BATCH_ROUTE = "/data/embed/text_batch"
+
+
+def configure_cache(maxsize: int) -> None:
+    """
+    Sets the maximum number of embeddings kept in the in-process cache.
+    Use 0 to disable caching.
+
+    Args:
+        maxsize (int): The maximum number of cached embeddings.
+    """
+    _CACHE.resize(maxsize)
+
+
+def cache_clear() -> None:
+    """
+    Removes all embeddings from the in-process cache.
+    """
+    _CACHE.clear()
+
 
-def text(content: str) -> List[float]:
+def configure_batcher(window_ms: float = 5, max_batch: int = 64) -> None:
     """
-    Generates embeddings for the given string.
+    Configures how concurrent `text_async` calls are coalesced into batched requests.
+    Calls made within `window_ms` of each other are sent together, up to `max_batch`
+    strings per request. Use max_batch=1 to send every call on its own.
+
+    Args:
+        window_ms (float, optional): How long to wait for more calls. Defaults to 5.
+        max_batch (int, optional): The maximum number of strings per request. Defaults to 64.
+    """
+    _BATCHER.configure(window_ms, max_batch)
+
+
+def _check(response: httpx.Response) -> None:
+    if not response.is_success:
+        raise APIError(
+            code=response.status_code,
+            message="Failed to generate embeddings",
+            response=response,
+        )
+
+
+def _from_cache(content: str, _no_cache: bool) -> Optional[List[float]]:
+    if _no_cache:
+        return None
+    cached = _CACHE.get(content_key(content))
+    return None if cached is None else list(cached)
+
+
+def _to_cache(content: str, embeddings: List[float], _no_cache: bool) -> None:
+    if not _no_cache:
+        _CACHE.set(content_key(content), list(embeddings))
+
+
+def _split(
+    contents: List[str], _no_cache: bool
+) -> Tuple[Dict[str, List[float]], List[str]]:
+    """
+    Splits the contents into cached embeddings and the unique strings that
+    still have to be embedded, in order of first appearance.
+    """
+    found: Dict[str, List[float]] = {}
+    pending: Dict[str, None] = {}
+    for content in contents:
+        if content in found or content in pending:
+            continue
+        cached = _from_cache(content, _no_cache)
+        if cached is None:
+            pending[content] = None
+        else:
+            found[content] = cached
+    return found, list(pending)
+
+
+def _expand(contents: List[str], found: Dict[str, List[float]]) -> List[List[float]]:
+    return [list(found[content]) for content in contents]
+
+
+def text(
+    content: str,
+    _no_cache: bool = False,
+    api_client: Optional[SyncAPIClient] = None,
+) -> List[float]:
+    """
+    Generates embeddings for the given string. Results are cached in-process,
+    identical content is embedded only once.
 
     Args:
         content (str): The text to generate embeddings for.
+        _no_cache (bool, optional): Skip the cache for sensitive content. Defaults to False.
+        api_client (SyncAPIClient, optional): The client to send the request with,
+            e.g. an assistant's. Defaults to the process-wide default client.
 
     Returns:
         List[float]: The embeddings for the text.
     """
-    api_client = SyncAPIClient()
+    cached = _from_cache(content, _no_cache)
+    if cached is not None:
+        return cached
+
+    api_client = api_client or default_sync_client()
     response = api_client.post(
         "/data/embed/text",
         {
             "content": content,
         },
+        idempotent=True,
     )
-    if not response.is_success:
-        raise APIError(
-            code=response.status_code,
-            message=f"Failed to generate embeddings: {response.text}",
-        )
-    embeddings: List[float] = response.json()["data"]["embedding"]
+    _check(response)
+    embeddings: List[float] = extract_data(response)["embedding"]
+    _to_cache(content, embeddings, _no_cache)
     return embeddings
+
+
+async def text_async(
+    content: str,
+    _no_cache: bool = False,
+    api_client: Optional[AsyncAPIClient] = None,
+) -> List[float]:
+    """
+    Generates embeddings for the given string asynchronously. Results are cached
+    in-process, identical content is embedded only once. Concurrent calls through
+    the default client are coalesced into batched requests, see `configure_batcher`.
+
+    Args:
+        content (str): The text to generate embeddings for.
+        _no_cache (bool, optional): Skip the cache for sensitive content. Defaults to False.
+        api_client (AsyncAPIClient, optional): The client to send the request with,
+            e.g. an assistant's. Defaults to the process-wide default client.
+
+    Returns:
+        List[float]: The embeddings for the text.
+    """
+    cached = _from_cache(content, _no_cache)
+    if cached is not None:
+        return cached
+
+    if api_client is not None and not api_client._shared:
+        # the batcher sends through the default client
+        return await _text_async(content, _no_cache, api_client)
+    if (
+        _no_cache
+        or _BATCHER.max_batch == 1
+        or _TEXT_BATCH_ROUTE in default_async_client().unsupported_routes
+    ):
+        return await _text_async(content, _no_cache)
+    return list(await _BATCHER.submit(content))
+
+
+async def _text_async(
+    content: str, _no_cache: bool, api_client: Optional[AsyncAPIClient] = None
+) -> List[float]:
+    api_client = api_client or default_async_client()
+    response = await api_client.post(
+        "/data/embed/text",
+        {
+            "content": content,
+        },
+        idempotent=True,
+    )
+    _check(response)
+    embeddings: List[float] = extract_data(response)["embedding"]
+    _to_cache(content, embeddings, _no_cache)
+    return embeddings
+
+
+def text_batch(contents: List[str], _no_cache: bool = False) -> List[List[float]]:
+    """
+    Generates embeddings for several strings with a single request. Duplicate and
+    already cached strings are not sent. If the API does not support batched
+    embeddings, the strings are embedded one by one.
+
+    Example:
+    ```python
+    import firedust
+
+    embeddings = firedust.data.embed.text_batch(["First chunk.", "Second chunk."])
+    ```
+
+    Args:
+        contents (List[str]): The texts to generate embeddings for.
+        _no_cache (bool, optional): Skip the cache for sensitive content. Defaults to False.
+
+    Returns:
+        List[List[float]]: The embeddings, in the same order as the contents.
+    """
+    found, pending = _split(contents, _no_cache)
+    if not pending:
+        return _expand(contents, found)
+
+    api_client = default_sync_client()
+    if _TEXT_BATCH_ROUTE not in api_client.unsupported_routes:
+        response = api_client.post(
+            _TEXT_BATCH_ROUTE, {"contents": pending}, idempotent=True
+        )
+        if not route_missing(response):
+            _check(response)
+            batch: List[List[float]] = extract_data(response)["embeddings"]
+            for content, embeddings in zip(pending, batch):
+                _to_cache(content, embeddings, _no_cache)
+                found[content] = embeddings
+            return _expand(contents, found)
+        api_client.unsupported_routes.add(_TEXT_BATCH_ROUTE)
+
+    for content in pending:
+        found[content] = text(content, _no_cache)
+    return _expand(contents, found)
+
+
+async def text_batch_async(
+    contents: List[str], _no_cache: bool = False
+) -> List[List[float]]:
+    """
+    Generates embeddings for several strings with a single request, asynchronously.
+    Duplicate and already cached strings are not sent. If the API does not support
+    batched embeddings, the strings are embedded concurrently, one request each.
+
+    Args:
+        contents (List[str]): The texts to generate embeddings for.
+        _no_cache (bool, optional): Skip the cache for sensitive content. Defaults to False.
+
+    Returns:
+        List[List[float]]: The embeddings, in the same order as the contents.
+    """
+    found, pending = _split(contents, _no_cache)
+    if not pending:
+        return _expand(contents, found)
+
+    api_client = default_async_client()
+    if _TEXT_BATCH_ROUTE not in api_client.unsupported_routes:
+        response = await api_client.post(
+            _TEXT_BATCH_ROUTE, {"contents": pending}, idempotent=True
+        )
+        if not route_missing(response):
+            _check(response)
+            batch: List[List[float]] = extract_data(response)["embeddings"]
+            for content, embeddings in zip(pending, batch):
+                _to_cache(content, embeddings, _no_cache)
+                found[content] = embeddings
+            return _expand(contents, found)
+        api_client.unsupported_routes.add(_TEXT_BATCH_ROUTE)
+
+    results = await asyncio.gather(
+        *(_text_async(content, _no_cache) for content in pending)
+    )
+    found.update(zip(pending, results))
+    return _expand(contents, found)
+
+
+_BATCHER: MicroBatcher[str, List[float]] = MicroBatcher(text_batch_async)
@@ -1,51 +1,98 @@
 from firedust.types.safety import SafetyCheck
-from firedust.utils.api import AsyncAPIClient, SyncAPIClient
+from firedust.utils.api import default_async_client, default_sync_client, extract_data
+from firedust.utils.cache import LRUCache, content_key
 from firedust.utils.errors import APIError
 
+_CACHE: LRUCache[SafetyCheck] = LRUCache(maxsize=1024)
 
-def text(content: str) -> SafetyCheck:
+
+def configure_cache(maxsize: int) -> None:
+    """
+    Sets the maximum number of safety checks kept in the in-process cache.
+    Use 0 to disable caching.
+
+    Args:
+        maxsize (int): The maximum number of cached safety checks.
+    """
+    _CACHE.resize(maxsize)
+
+
+def cache_clear() -> None:
+    """
+    Removes all safety checks from the in-process cache.
+    """
+    _CACHE.clear()
+
+
+def text(content: str, _no_cache: bool = False) -> SafetyCheck:
     """
     Checks the safety of the given text using the Firedust API.
+    Results are cached in-process, identical content is checked only once.
 
     Args:
         content (str): The text to check for safety.
+        _no_cache (bool, optional): Skip the cache for sensitive content. Defaults to False.
 
     Returns:
         SafetyCheck: A model with safety scores for each category.
     """
-    api_client = SyncAPIClient()
+    key = content_key(content)
+    if not _no_cache:
+        cached = _CACHE.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+    api_client = default_sync_client()
     response = api_client.post(
         "/data/safetycheck/text",
         {"content": content},
+        idempotent=True,
     )
     if not response.is_success:
         raise APIError(
             code=response.status_code,
-            message=f"Failed to check text safety: {response.text}",
+            message="Failed to check text safety",
+            response=response,
         )
 
-    return SafetyCheck.model_validate(response.json()["data"])
+    result = SafetyCheck.model_validate(extract_data(response))
+    if not _no_cache:
+        _CACHE.set(key, result.model_copy(deep=True))
+    return result
 
 
-async def text_async(content: str) -> SafetyCheck:
+async def text_async(content: str, _no_cache: bool = False) -> SafetyCheck:
     """
     Checks the safety of the given text using the Firedust API asynchronously.
+    Results are cached in-process, identical content is checked only once.
 
     Args:
         content (str): The text to check for safety.
+        _no_cache (bool, optional): Skip the cache for sensitive content. Defaults to False.
 
     Returns:
         SafetyCheck: A model with safety scores for each category.
     """
-    api_client = AsyncAPIClient()
+    key = content_key(content)
+    if not _no_cache:
+        cached = _CACHE.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+    api_client = default_async_client()
     response = await api_client.post(
         "/data/safetycheck/text",
         {"content": content},
+        idempotent=True,
     )
     if not response.is_success:
         raise APIError(
             code=response.status_code,
-            message=f"Failed to check text safety: {response.text}",
+            message="Failed to check text safety",
+            response=response,
         )
 
-    return SafetyCheck.model_validate(response.json()["data"])
+    result = SafetyCheck.model_validate(extract_data(response))
+    if not _no_cache:
+        _CACHE.set(key, result.model_copy(deep=True))
+    return result
@@ -40,12 +40,16 @@ Example:
 
 from typing import List
 
-from firedust.types import APIContent, Assistant, AssistantConfig, AsyncAssistant
+from pydantic import TypeAdapter
+
+from firedust.types import Assistant, AssistantConfig, AsyncAssistant
 from firedust.types.base import INFERENCE_MODEL
-from firedust.utils.api import AsyncAPIClient, SyncAPIClient
+from firedust.utils.api import default_async_client, default_sync_client, extract_data
 from firedust.utils.errors import APIError
 from firedust.utils.logging import LOG
 
+_CONFIG_LIST_ADAPTER = TypeAdapter(List[AssistantConfig])
+
 
 def create(
     name: str,
@@ -64,17 +68,17 @@ def create(
         Assistant: A new instance of the assistant class.
     """
     config = AssistantConfig(name=name, instructions=instructions, model=model)
-    api_client = SyncAPIClient()
+    api_client = default_sync_client()
 
-    response = api_client.post("/assistant", data=config.model_dump())
+    response = api_client.post("/assistant", content=config.model_dump_json().encode())
     if not response.is_success:
-        api_client.close()
         raise APIError(
             code=response.status_code,
-            message=f"Failed to create an assistant with config {config}: {response.text}",
+            message=f"Failed to create an assistant with config {config}",
+            response=response,
         )
     LOG.info(
-        f"Assistant {config.name} was created successfully and saved to the cloud."
+        "Assistant %s was created successfully and saved to the cloud.", config.name
     )
     return Assistant._create_instance(config, api_client)
 
@@ -96,17 +100,19 @@ async def async_create(
         AsyncAssistant: A new instance of the AsyncAssistant class.
     """
     config = AssistantConfig(name=name, instructions=instructions, model=model)
-    api_client = AsyncAPIClient()
+    api_client = default_async_client()
 
-    response = await api_client.post("/assistant", data=config.model_dump())
+    response = await api_client.post(
+        "/assistant", content=config.model_dump_json().encode()
+    )
     if not response.is_success:
-        await api_client.close()
         raise APIError(
             code=response.status_code,
-            message=f"Failed to create an assistant with config {config}: {response.text}",
+            message=f"Failed to create an assistant with config {config}",
+            response=response,
         )
     LOG.info(
-        f"Assistant {config.name} was created successfully and saved to the cloud."
+        "Assistant %s was created successfully and saved to the cloud.", config.name
     )
     return await AsyncAssistant._create_instance(config, api_client)
 
@@ -121,16 +127,15 @@ def load(name: str) -> Assistant:
     Returns:
         Assistant: A new instance of the Assistant class.
     """
-    api_client = SyncAPIClient()
+    api_client = default_sync_client()
     response = api_client.get("/assistant", params={"name": name})
     if not response.is_success:
-        api_client.close()
         raise APIError(
             code=response.status_code,
-            message=f"Failed to load assistant {name}: {response.text}",
+            message=f"Failed to load assistant {name}",
+            response=response,
         )
-    content = APIContent(**response.json())
-    config = AssistantConfig(**content.data)
+    config = AssistantConfig.model_validate(extract_data(response))
     return Assistant._create_instance(config, api_client)
 
 
@@ -144,16 +149,15 @@ async def async_load(name: str) -> AsyncAssistant:
     Returns:
         AsyncAssistant: A new instance of the AsyncAssistant class.
     """
-    api_client = AsyncAPIClient()
+    api_client = default_async_client()
     response = await api_client.get("/assistant", params={"name": name})
     if not response.is_success:
-        await api_client.close()
         raise APIError(
             code=response.status_code,
-            message=f"Failed to load the assistant with id {name}: {response.text}",
+            message=f"Failed to load the assistant with id {name}",
+            response=response,
         )
-    content = APIContent(**response.json())
-    config = AssistantConfig(**content.data)
+    config = AssistantConfig.model_validate(extract_data(response))
     return await AsyncAssistant._create_instance(config, api_client)
 
 
@@ -164,16 +168,15 @@ def list() -> List[Assistant]:
     Returns:
         List[Assistant]: A list of Assistant objects.
     """
-    api_client = SyncAPIClient()
+    api_client = default_sync_client()
     response = api_client.get("/assistant/list")
     if not response.is_success:
-        api_client.close()
         raise APIError(
             code=response.status_code,
-            message=f"Failed to list the assistants: {response.text}",
+            message="Failed to list the assistants",
+            response=response,
         )
-    content = APIContent(**response.json())
-    configs = [AssistantConfig(**assistant) for assistant in content.data]
+    configs = _CONFIG_LIST_ADAPTER.validate_python(extract_data(response))
     return [Assistant._create_instance(config, api_client) for config in configs]
 
 
@@ -184,16 +187,15 @@ async def async_list() -> List[AsyncAssistant]:
     Returns:
         List[AsyncAssistant]: A list of AsyncAssistant objects.
     """
-    api_client = AsyncAPIClient()
+    api_client = default_async_client()
     response = await api_client.get("/assistant/list")
     if not response.is_success:
-        await api_client.close()
         raise APIError(
             code=response.status_code,
-            message=f"Failed to list the assistants: {response.text}",
+            message="Failed to list the assistants",
+            response=response,
         )
-    content = APIContent(**response.json())
-    configs = [AssistantConfig(**assistant) for assistant in content.data]
+    configs = _CONFIG_LIST_ADAPTER.validate_python(extract_data(response))
     return [
         await AsyncAssistant._create_instance(config, api_client) for config in configs
     ]
@@ -1,6 +1,6 @@
 from typing import Any, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from .base import UNIX_TIMESTAMP
 
@@ -12,5 +12,5 @@ class APIContent(BaseModel):
 
     status: Literal["success", "error"]
     timestamp: UNIX_TIMESTAMP
-    data: Any = {}
+    data: Any = Field(default_factory=dict)
     message: Optional[str] = None
@@ -1,6 +1,6 @@
 from typing import List
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field
 
 from .base import INFERENCE_MODEL
 from .interface import Interfaces
@@ -22,16 +22,9 @@ class AssistantConfig(BaseModel):
         abilities (Tools, optional): List of function tools (abilities) available to the assistant. Defaults to [].
     """
 
-    name: str
+    name: str = Field(min_length=1)
     instructions: str
     model: INFERENCE_MODEL = "openai/gpt-4o"
-    attached_memories: List[ASSISTANT_NAME] = []
-    interfaces: Interfaces = Interfaces()
-    abilities: Tools = []
-
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, name: str) -> str:
-        if len(name) < 1:
-            raise ValueError("Assistant name must be at least 1 character")
-        return name
+    attached_memories: List[ASSISTANT_NAME] = Field(default_factory=list)
+    interfaces: Interfaces = Field(default_factory=Interfaces)
+    abilities: Tools = Field(default_factory=list)
@@ -2,16 +2,11 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Sequence, Union
 from uuid import UUID
 
-from pydantic import (
-    BaseModel,
-    Field,
-    ValidationInfo,
-    field_serializer,
-    field_validator,
-    model_validator,
-)
+from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator
 from typing_extensions import Annotated
 
+from firedust.utils import checks
+
 from .base import UNIX_TIMESTAMP, BaseConfig
 from .tools import ToolCalls
 
@@ -188,14 +183,7 @@ class Message(BaseConfig):
 
         # Numeric inputs
         if isinstance(v, (int, float)):
-            # µs (≥ 1e14) → seconds
-            if v > 1e14:
-                return v / 1_000_000
-            # ms (≥ 1e11) → seconds
-            if v > 1e11:
-                return v / 1_000
-            # Already seconds
-            return float(v)
+            return checks.to_seconds(v)
 
 
 class UserMessage(Message):
@@ -261,14 +249,6 @@ class MessageReferences(BaseModel):
         ..., description="The references to the relevant conversations."
     )
 
-    @field_serializer("memory_ids", when_used="always")
-    def serialize_memory_refs(self, value: Sequence[UUID]) -> Sequence[str]:
-        return [str(ref) for ref in value]
-
-    @field_serializer("message_ids", when_used="always")
-    def serialize_conversation_refs(self, value: Sequence[UUID]) -> Sequence[str]:
-        return [str(ref) for ref in value]
-
 
 class ReferencedMessage(Message):
     references: Optional[MessageReferences] = Field(
@@ -298,10 +278,6 @@ class MessageContext(MessageReferences):
         ..., description="The instructions related to the message."
     )
 
-    @field_serializer("message_id", when_used="always")
-    def serialize_message_id(self, value: UUID) -> str:
-        return str(value)
-
 
 # ------------------------------------------------------------------
 # Response format definitions (structured outputs)
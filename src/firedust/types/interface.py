@@ -1,6 +1,6 @@
 from typing import Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class InterfaceConfig(BaseModel):
@@ -8,6 +8,9 @@ class InterfaceConfig(BaseModel):
     Represents an interface of the assistant.
     """
 
+    # Only built on first use, most assistants never configure an interface
+    model_config = ConfigDict(defer_build=True)
+
     interface: Literal["slack"]  # space for more interfaces
 
 
@@ -16,6 +19,8 @@ class SlackTokens(BaseModel):
     Represents the credentials of a Slack app.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     app_token: str
     bot_token: str
 
@@ -25,6 +30,8 @@ class SlackCredentials(BaseModel):
     Represents the credentials of a Slack app.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     signing_secret: str
     client_id: str
     client_secret: str
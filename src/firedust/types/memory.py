@@ -1,8 +1,7 @@
 from datetime import datetime
 from typing import Literal, Optional
-from uuid import UUID
 
-from pydantic import Field, field_serializer, field_validator
+from pydantic import Field, field_validator
 
 from firedust.utils import checks
 
@@ -38,13 +37,9 @@ class MemoryItem(BaseConfig):
     @field_validator("timestamp")
     @classmethod
     def validate_timestamp(cls, timestamp: UNIX_TIMESTAMP) -> UNIX_TIMESTAMP:
-        # Check that the timestamp is UNIX format
-        try:
-            checks.is_unix_timestamp(timestamp)
-        except ValueError as e:
-            raise ValueError(f"Invalid timestamp: {e}")
+        # Milliseconds and microseconds are stored as seconds, like in Message. Times
+        # after 2038 are valid, only times before the UNIX epoch are rejected
+        timestamp = checks.to_seconds(timestamp)
+        if timestamp < 0:
+            raise ValueError(f"Invalid timestamp: {timestamp}")
         return timestamp
-
-    @field_serializer("assistant", when_used="always")
-    def serialize_collection_id(self, value: UUID) -> str:
-        return str(value)
@@ -1,34 +1,587 @@
+import asyncio
+import atexit
+import importlib.util
+import json
 import os
+import random
+import socket
+import threading
+import time
+import weakref
+from datetime import date
 from types import TracebackType
-from typing import Any, AsyncIterator, Dict, Iterator, Optional, Type
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+from uuid import UUID
 
 import httpx
+from pydantic import BaseModel
 
-from firedust.utils.errors import MissingFiredustKeyError
+from firedust.utils.cache import LRUCache
+from firedust.utils.errors import APIError, MissingFiredustKeyError
 
 # Use environment variable with fallback to production URL
 BASE_URL = os.getenv("FIREDUST_API_URL", "https://api.firedust.dev")
 TIMEOUT = 300
 
+# Transient failures that are worth retrying with a backoff
+RETRY_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.05  # seconds, doubled on every attempt
+MAX_RETRY_DELAY = 10.0  # upper bound for a server provided Retry-After
+# Only reads are retried on any transient failure. Writes (PUT appends memories and
+# messages, DELETE fails with 404 once it succeeded) are only retried when the
+# connection failed before the request was sent
+SAFE_METHODS = frozenset({"get"})
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+_RETRY = True
+
+# Fail fast once the API keeps failing, instead of stacking up retries. Only server
+# errors and connection failures count, rate limits (429) and request timeouts (408)
+# are the caller's to handle and are passed through with their Retry-After
+BREAKER_THRESHOLD = 5  # consecutive failed requests before the circuit opens
+BREAKER_COOLDOWN = 30.0  # seconds to fail fast before trying the API again
+_BREAKER = True
+
+# Connection pool of the clients; with HTTP/2 concurrent requests are multiplexed
+# over a few connections instead of one connection each. Idle connections are kept
+# for a minute, so calls a few seconds apart skip the TCP and TLS handshakes
+LIMITS = httpx.Limits(
+    max_connections=32, max_keepalive_connections=16, keepalive_expiry=60.0
+)
+_HTTP2 = False
+
+# Small JSON requests should not wait on Nagle's algorithm, and the OS probes
+# idle pooled connections so dead ones are noticed
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+# Successful GET responses are reused for this many seconds, 0 disables the cache
+_CACHE_TTL = 0.0
+GET_CACHE_SIZE = 128
+
+# Open a connection in the background as soon as a client is created
+_WARM_CONNECT = False
+_WARM_LOOPS: "weakref.WeakSet[asyncio.AbstractEventLoop]" = weakref.WeakSet()
+_WARM_TASKS: "Set[asyncio.Task[None]]" = set()
+
+# One pooled async HTTP client per event loop, shared by every AsyncAPIClient
+# so that assistants loaded in the same process reuse TCP/TLS connections.
+# Keyed weakly by loop: the pool is dropped together with its loop.
+_ASYNC_CLIENTS: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]"
+) = weakref.WeakKeyDictionary()
+# Replaced pools of event loops that weren't running, closed on the loop's next call
+_STALE_ASYNC_CLIENTS: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, List[httpx.AsyncClient]]"
+) = weakref.WeakKeyDictionary()
+
+
+def configure(
+    http2: Optional[bool] = None,
+    retry: Optional[bool] = None,
+    warm_connect: Optional[bool] = None,
+    cache_ttl: Optional[float] = None,
+    circuit_breaker: Optional[bool] = None,
+) -> None:
+    """
+    Configure the HTTP clients used by firedust. Options left as None are unchanged.
+
+    Example:
+    ```python
+    import firedust
+
+    firedust.configure(http2=True)
+    ```
+
+    Args:
+        http2 (bool, optional): Multiplex concurrent requests over HTTP/2. Applies to the
+            async pools and to sync clients created afterwards. The existing async pools
+            are closed, so change it before sending requests. Requires the h2 package,
+            e.g. `pip install httpx[http2]`.
+        retry (bool, optional): Retry read requests on transient failures, and
+            writes when the connection to the API could not be established.
+            Enabled by default.
+        warm_connect (bool, optional): Connect to the API in the background when a
+            client is created, so the first call doesn't pay for the TCP and TLS
+            handshakes. Disabled by default.
+        cache_ttl (float, optional): Reuse successful GET responses for this many
+            seconds. Any successful write through the same client drops the cached
+            responses. Disabled (0) by default.
+        circuit_breaker (bool, optional): Fail fast for a while once requests to the
+            API keep failing with server or connection errors, instead of sending
+            every request to an API that is down. Enabled by default.
+    """
+    global _BREAKER, _CACHE_TTL, _HTTP2, _RETRY, _WARM_CONNECT
+    if cache_ttl is not None:
+        if cache_ttl < 0:
+            raise ValueError("cache_ttl must be a non-negative number.")
+        _CACHE_TTL = cache_ttl
+    if retry is not None:
+        _RETRY = retry
+    if warm_connect is not None:
+        _WARM_CONNECT = warm_connect
+    if circuit_breaker is not None:
+        _BREAKER = circuit_breaker
+    if http2 is not None:
+        if http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "HTTP/2 requires the h2 package. Install it with `pip install httpx[http2]`."
+            )
+        _HTTP2 = http2
+        # Pools are created lazily, the next request picks up the new setting
+        _close_async_clients()
+
+
+def _close_async_clients() -> None:
+    """
+    Close the pooled async HTTP clients on their own event loops. The pools of loops
+    that aren't running are closed when the loop next asks for a pool.
+    """
+    for loop, client in list(_ASYNC_CLIENTS.items()):
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        elif not loop.is_closed():
+            _STALE_ASYNC_CLIENTS.setdefault(loop, []).append(client)
+    _ASYNC_CLIENTS.clear()
+
+
+def _shared_async_client() -> httpx.AsyncClient:
+    """
+    Return the pooled async HTTP client of the running event loop, creating it on first use.
+    """
+    loop = asyncio.get_running_loop()
+    for stale in _STALE_ASYNC_CLIENTS.pop(loop, []):
+        asyncio.run_coroutine_threadsafe(stale.aclose(), loop)
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        transport = httpx.AsyncHTTPTransport(
+            limits=LIMITS, http2=_HTTP2, socket_options=SOCKET_OPTIONS
+        )
+        client = httpx.AsyncClient(timeout=TIMEOUT, transport=transport)
+        _ASYNC_CLIENTS[loop] = client
+    return client
+
+
+class CircuitBreaker:
+    """
+    Tracks consecutive failed requests to an API. After `threshold` failures in a row
+    the circuit opens and requests fail fast for `cooldown` seconds. Then the circuit
+    is half-open: a single request is let through to probe the API while the others
+    keep failing fast, until the probe's outcome closes or reopens the circuit.
+    """
+
+    def __init__(
+        self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN
+    ) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def check(self) -> bool:
+        """
+        Raise an APIError if the circuit is open. Returns True if the request is the
+        probe of a half-open circuit, the caller must then call `release()` once the
+        request is done.
+        """
+        with self._lock:
+            failures = self._failures
+            if failures < self.threshold:
+                return False
+            if (
+                not self._probing
+                and time.monotonic() - self._opened_at >= self.cooldown
+            ):
+                self._probing = True
+                return True
+        raise APIError(
+            code=503,
+            message=f"API unavailable after {failures} consecutive failures, "
+            "failing fast",
+        )
+
+    def release(self) -> None:
+        """
+        Let the next request probe the API again, after the probe is done.
+        """
+        with self._lock:
+            self._probing = False
+
+    def record(self, success: bool) -> None:
+        """
+        Record the outcome of a request: a success closes the circuit, a failure
+        counts towards opening it.
+        """
+        with self._lock:
+            if success:
+                self._failures = 0
+                return
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+
+
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def _breaker(base_url: str) -> Optional[CircuitBreaker]:
+    """
+    Return the circuit breaker of an API, or None if the breaker is turned off.
+    """
+    if not _BREAKER:
+        return None
+    breaker = _BREAKERS.get(base_url)
+    if breaker is None:
+        with _BREAKERS_LOCK:
+            breaker = _BREAKERS.setdefault(base_url, CircuitBreaker())
+    return breaker
+
+
+def _warm_sync(client: httpx.Client) -> None:
+    try:
+        client.get("/health")
+    except httpx.HTTPError:
+        pass  # best effort, the first real request reports connection errors
+
+
+async def _warm_async(base_url: str) -> None:
+    try:
+        await _shared_async_client().get(base_url + "/health")
+    except httpx.HTTPError:
+        pass  # best effort, the first real request reports connection errors
+
+
+def _retry_delay(response: Optional[httpx.Response], attempt: int) -> float:
+    """
+    Seconds to wait before the next attempt. Honors a numeric Retry-After header,
+    otherwise uses an exponential backoff with jitter.
+    """
+    retry_after = None if response is None else response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return min(float(retry_after), MAX_RETRY_DELAY)
+        except ValueError:
+            pass  # HTTP-date values fall back to the backoff
+    return RETRY_BACKOFF * (1 << attempt) + random.uniform(0, RETRY_BACKOFF)
+
+
+def with_retry(
+    send: Callable[[], httpx.Response],
+    retries: int = MAX_RETRIES,
+    connect_only: bool = False,
+) -> httpx.Response:
+    """
+    Send a request and retry it on transient failures: connection errors, timeouts
+    and RETRY_STATUS_CODES. Requests that are not safe to repeat must pass
+    connect_only=True.
+
+    Args:
+        send (Callable[[], httpx.Response]): Sends the request.
+        retries (int): The maximum number of retries. Defaults to MAX_RETRIES.
+        connect_only (bool): Only retry when the connection failed before the request
+            was sent, e.g. for writes that are not safe to repeat. Defaults to False.
+
+    Returns:
+        httpx.Response: The last response received.
+    """
+    retry_errors = CONNECT_ERRORS if connect_only else (httpx.TransportError,)
+    for attempt in range(retries):
+        try:
+            response = send()
+        except retry_errors:
+            time.sleep(_retry_delay(None, attempt))
+            continue
+        if connect_only or response.status_code not in RETRY_STATUS_CODES:
+            return response
+        time.sleep(_retry_delay(response, attempt))
+    return send()
+
+
+async def async_with_retry(
+    send: Callable[[], Awaitable[httpx.Response]],
+    retries: int = MAX_RETRIES,
+    connect_only: bool = False,
+) -> httpx.Response:
+    """
+    Send a request and retry it on transient failures, asynchronously: connection
+    errors, timeouts and RETRY_STATUS_CODES. Requests that are not safe to repeat
+    must pass connect_only=True.
+
+    Args:
+        send (Callable[[], Awaitable[httpx.Response]]): Sends the request.
+        retries (int): The maximum number of retries. Defaults to MAX_RETRIES.
+        connect_only (bool): Only retry when the connection failed before the request
+            was sent, e.g. for writes that are not safe to repeat. Defaults to False.
+
+    Returns:
+        httpx.Response: The last response received.
+    """
+    retry_errors = CONNECT_ERRORS if connect_only else (httpx.TransportError,)
+    for attempt in range(retries):
+        try:
+            response = await send()
+        except retry_errors:
+            await asyncio.sleep(_retry_delay(None, attempt))
+            continue
+        if connect_only or response.status_code not in RETRY_STATUS_CODES:
+            return response
+        await asyncio.sleep(_retry_delay(response, attempt))
+    return await send()
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Serialize the values JSON has no type for the way orjson does natively: UUIDs,
+    dates and datetimes as strings. Anything else is a mistake in the payload and
+    raises a TypeError instead of being sent as its repr.
+    """
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, date):  # datetime is a subclass of date
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(data: Any) -> bytes:
+    """
+    Encode data as compact JSON with the standard library, byte for byte like orjson.
+    """
+    return json.dumps(
+        data, separators=(",", ":"), ensure_ascii=False, default=_json_default
+    ).encode()
+
+
+try:
+    import orjson
+
+    def dumps(data: Any) -> bytes:
+        """
+        Encode data as compact JSON. UUIDs, dates and datetimes are serialized as
+        strings, other values JSON has no type for raise a TypeError.
+        """
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(content: bytes) -> Any:
+        """
+        Decode JSON, e.g. the content of an API response.
+        """
+        return orjson.loads(content)
+
+except ImportError:  # orjson is optional, fall back to the standard library
+
+    def dumps(data: Any) -> bytes:
+        """
+        Encode data as compact JSON. UUIDs, dates and datetimes are serialized as
+        strings, other values JSON has no type for raise a TypeError.
+        """
+        return _stdlib_dumps(data)
+
+    def loads(content: bytes) -> Any:
+        """
+        Decode JSON, e.g. the content of an API response.
+        """
+        return json.loads(content)
+
+
+def extract_data(response: httpx.Response) -> Any:
+    """
+    Return the `data` field of a successful API response without building the
+    full APIContent envelope.
+    """
+    return loads(response.content)["data"]
+
+
+def route_missing(response: httpx.Response) -> bool:
+    """
+    Whether the response is a 404 because the API doesn't have the route at all, e.g.
+    an older API without a batch endpoint. Unknown routes get the framework's bare
+    {"detail": "Not Found"} body, unlike missing resources such as an unknown
+    assistant.
+    """
+    if response.status_code != 404:
+        return False
+    try:
+        return bool(loads(response.content) == {"detail": "Not Found"})
+    except ValueError:
+        return False
+
+
+def _encode(data: Optional[Dict[str, Any]]) -> Optional[bytes]:
+    """
+    Encode a request payload as compact JSON. Bulk payloads (memories, chat history)
+    are noticeably smaller without the whitespace of the default JSON separators.
+    """
+    if data is None:
+        return None
+    return dumps(data)
+
+
+def dump_models(models: Iterable[BaseModel]) -> bytes:
+    """
+    Serialize models to a JSON array in a single pass with pydantic's own JSON encoder,
+    instead of dumping them to dicts and encoding those again.
+    """
+    return b"[" + b",".join(model.model_dump_json().encode() for model in models) + b"]"
+
+
+def json_body(data: Dict[str, Any], **raw: bytes) -> bytes:
+    """
+    Encode a request payload as compact JSON, splicing in already serialized
+    JSON values (see `dump_models`) under the given keys.
+    """
+    members = [dumps(data)[1:-1]]
+    members.extend(dumps(key) + b":" + value for key, value in raw.items())
+    return b"{" + b",".join(member for member in members if member) + b"}"
+
 
 class BaseAPIClient:
-    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL) -> None:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = BASE_URL,
+        cache_ttl: Optional[float] = None,
+    ) -> None:
         api_key = api_key or os.environ.get("FIREDUST_API_KEY")
         if not api_key:
             raise MissingFiredustKeyError()
 
         self.base_url = base_url
         self.api_key = api_key
-        self.headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}",
-        }
+        # routes the API doesn't have (see route_missing), skipped from then on
+        self.unsupported_routes: Set[str] = set()
+        # encoded once, so merging them into each request copies instead of re-encoding
+        self.headers = httpx.Headers(
+            {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {api_key}",
+            }
+        )
+        # seconds to reuse GET responses, None follows firedust.configure(cache_ttl=...)
+        self.cache_ttl = cache_ttl
+        self._get_cache: LRUCache[Tuple[float, httpx.Response]] = LRUCache(
+            GET_CACHE_SIZE
+        )
+
+    def invalidate(self, url_prefix: str = "") -> None:
+        """
+        Drop the cached GET responses of the URLs starting with `url_prefix`, all of
+        them by default.
+        """
+        for key in self._get_cache.keys():
+            if isinstance(key, tuple) and key[0].startswith(url_prefix):
+                self._get_cache.pop(key)
+
+    def _get_cache_key(
+        self, url: str, params: Optional[Dict[str, Any]]
+    ) -> Optional[Tuple[str, str]]:
+        ttl = _CACHE_TTL if self.cache_ttl is None else self.cache_ttl
+        if ttl <= 0:
+            return None
+        return url, str(httpx.QueryParams(params)) if params else ""
+
+    def _cached(self, key: Tuple[str, str]) -> Optional[httpx.Response]:
+        entry = self._get_cache.get(key)
+        if entry is None:
+            return None
+        ttl = _CACHE_TTL if self.cache_ttl is None else self.cache_ttl
+        stored_at, response = entry
+        if time.monotonic() - stored_at < ttl:
+            return response
+        # keep expired responses with an ETag around, they are revalidated instead
+        if "etag" not in response.headers:
+            self._get_cache.pop(key)
+        return None
+
+    def _revalidation_headers(self, key: Tuple[str, str]) -> Optional[Dict[str, str]]:
+        entry = self._get_cache.get(key)
+        if entry is None:
+            return None
+        etag = entry[1].headers.get("etag")
+        return None if etag is None else {"If-None-Match": etag}
+
+    def _store(
+        self, key: Optional[Tuple[str, str]], response: httpx.Response
+    ) -> Optional[httpx.Response]:
+        """
+        Cache a successful GET response and return the response to use. A 304 Not
+        Modified renews the cached response it revalidated, or returns None if that
+        response was evicted or dropped by a write in the meantime.
+        """
+        if key is None:
+            return response
+        if response.status_code == 304:
+            entry = self._get_cache.get(key)
+            if entry is None:
+                return None
+            response = entry[1]
+        if response.is_success:
+            self._get_cache.set(key, (time.monotonic(), response))
+        return response
+
+    def _written(self, method: str, idempotent: bool, response: httpx.Response) -> None:
+        # a successful write may change any cached read, read-only POSTs are idempotent
+        if method != "get" and not idempotent and response.is_success:
+            self._get_cache.clear()
 
 
 class SyncAPIClient(BaseAPIClient):
-    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL) -> None:
-        super().__init__(api_key, base_url)
-        self.client: httpx.Client = httpx.Client(timeout=TIMEOUT, headers=self.headers)
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = BASE_URL,
+        cache_ttl: Optional[float] = None,
+    ) -> None:
+        super().__init__(api_key, base_url, cache_ttl)
+        self._client = self._connect()
+        # The process-wide default client is only closed by firedust.shutdown(), and
+        # reconnects on its next request
+        self._shared = False
+        self._reconnect_lock = threading.Lock()
+        if _WARM_CONNECT:
+            threading.Thread(
+                target=_warm_sync, args=(self._client,), daemon=True
+            ).start()
+
+    def _connect(self) -> httpx.Client:
+        return httpx.Client(
+            base_url=self.base_url,
+            timeout=TIMEOUT,
+            headers=self.headers,
+            transport=httpx.HTTPTransport(
+                limits=LIMITS, http2=_HTTP2, socket_options=SOCKET_OPTIONS
+            ),
+        )
+
+    @property
+    def client(self) -> httpx.Client:
+        if self._shared and self._client.is_closed:
+            # released by firedust.shutdown(), the assistants holding it keep working
+            with self._reconnect_lock:
+                if self._client.is_closed:
+                    self._client = self._connect()
+        return self._client
+
+    @client.setter
+    def client(self, client: httpx.Client) -> None:
+        self._client = client
 
     def __enter__(self) -> "SyncAPIClient":
         return self
@@ -39,23 +592,58 @@ class SyncAPIClient(BaseAPIClient):
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
-        self.client.close()
+        self.close()
 
     def __del__(self) -> None:
-        self.client.close()
+        self.close()
 
     def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
-        return self._request("get", url, params=params)
-
-    def post(self, url: str, data: Optional[Dict[str, Any]] = None) -> httpx.Response:
-        return self._request("post", url, data=data)
+        key = self._get_cache_key(url, params)
+        headers = None
+        if key is not None:
+            cached = self._cached(key)
+            if cached is not None:
+                return cached
+            headers = self._revalidation_headers(key)
+        response = self._request("get", url, params=params, headers=headers)
+        stored = self._store(key, response)
+        if stored is None:
+            # Nothing left to revalidate, fetch the full response instead
+            response = self._request("get", url, params=params)
+            stored = self._store(key, response)
+        return response if stored is None else stored
+
+    def post(
+        self,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        idempotent: bool = False,
+    ) -> httpx.Response:
+        """
+        Send a POST request to the API. Pass idempotent=True for read-only requests,
+        they are retried on transient failures like GET requests.
+        """
+        return self._request(
+            "post", url, data=data, content=content, idempotent=idempotent
+        )
 
-    def put(self, url: str, data: Optional[Dict[str, Any]] = None) -> httpx.Response:
-        return self._request("put", url, data=data)
+    def put(
+        self,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+    ) -> httpx.Response:
+        return self._request("put", url, data=data, content=content)
 
-    def patch(self, url: str, data: Optional[Dict[str, Any]] = None) -> httpx.Response:
+    def patch(
+        self,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+    ) -> httpx.Response:
         """Send a JSON *PATCH* request to the API."""
-        return self._request("patch", url, data=data)
+        return self._request("patch", url, data=data, content=content)
 
     def delete(
         self, url: str, params: Optional[Dict[str, Any]] = None
@@ -63,19 +651,37 @@ class SyncAPIClient(BaseAPIClient):
         return self._request("delete", url, params=params)
 
     def get_stream(
-        self, url: str, params: Optional[Dict[str, Any]] = None
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        chunk_size: Optional[int] = None,
     ) -> Iterator[bytes]:
-        url = self.base_url + url
+        """
+        Yields the response body as it arrives. By default every network read is
+        yielded right away, which gives the lowest latency to the first event. Set
+        `chunk_size` to coalesce reads into fewer, larger chunks for bulk transfers.
+        """
         with self.client.stream("get", url, params=params) as response:
-            for chunk in response.iter_bytes():
+            for chunk in response.iter_bytes(chunk_size):
                 yield chunk
 
     def post_stream(
-        self, url: str, data: Optional[Dict[str, Any]] = None
+        self,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        chunk_size: Optional[int] = None,
+        content: Optional[bytes] = None,
     ) -> Iterator[bytes]:
-        url = self.base_url + url
-        with self.client.stream("post", url, json=data) as response:
-            for chunk in response.iter_bytes():
+        """
+        Yields the response body as it arrives. By default every network read is
+        yielded right away, which gives the lowest latency to the first event. Set
+        `chunk_size` to coalesce reads into fewer, larger chunks for bulk transfers.
+        The body is either a `data` payload or an already serialized JSON `content`.
+        """
+        if content is None:
+            content = _encode(data)
+        with self.client.stream("post", url, content=content) as response:
+            for chunk in response.iter_bytes(chunk_size):
                 yield chunk
 
     def _request(
@@ -84,23 +690,96 @@ class SyncAPIClient(BaseAPIClient):
         url: str,
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        idempotent: bool = False,
+        headers: Optional[Dict[str, str]] = None,
     ) -> httpx.Response:
-        url = self.base_url + url
-        response = self.client.request(method, url, params=params, json=data)
+        """
+        Send a request to the API. The body is either a `data` payload, encoded as
+        JSON here, or an already serialized JSON `content` (see `json_body`).
+        GET and idempotent requests are retried on transient failures, other writes
+        only on connection failures.
+        """
+        if content is None:
+            content = _encode(data)
+        breaker = _breaker(self.base_url)
+        probe = breaker is not None and breaker.check()
+
+        def send() -> httpx.Response:
+            return self.client.request(
+                method, url, params=params, content=content, headers=headers
+            )
+
+        try:
+            if _RETRY:
+                response = with_retry(
+                    send, connect_only=not (idempotent or method in SAFE_METHODS)
+                )
+            else:
+                response = send()
+        except httpx.TransportError:
+            if breaker is not None:
+                breaker.record(success=False)
+            raise
+        else:
+            if breaker is not None:
+                breaker.record(success=response.status_code < 500)
+        finally:
+            if breaker is not None and probe:
+                breaker.release()
+        self._written(method, idempotent, response)
         return response
 
     def close(self) -> None:
         """
-        Close the underlying HTTP client.
+        Close the underlying HTTP client. The shared default client stays open,
+        use firedust.shutdown() to release it.
         """
-        self.client.close()
+        if not self._shared:
+            self._client.close()
 
 
 class AsyncAPIClient(BaseAPIClient):
-    def __init__(self, api_key: Optional[str] = None, base_url: str = BASE_URL) -> None:
-        super().__init__(api_key, base_url)
-        self.client = httpx.AsyncClient(timeout=TIMEOUT, headers=self.headers)
+    """
+    Async API client. The underlying connection pool is shared by all instances
+    running on the same event loop, the client only carries the credentials.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = BASE_URL,
+        cache_ttl: Optional[float] = None,
+    ) -> None:
+        super().__init__(api_key, base_url, cache_ttl)
         self._closed = False
+        # The process-wide default client is never closed, its pools are released
+        # by firedust.async_shutdown()
+        self._shared = False
+        if _WARM_CONNECT:
+            self._warm_connect()
+
+    def _warm_connect(self) -> None:
+        """
+        Open a connection of the event loop's shared pool in the background, once per
+        loop. Does nothing outside of a running event loop.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if loop in _WARM_LOOPS:
+            return
+        _WARM_LOOPS.add(loop)
+        task = loop.create_task(_warm_async(self.base_url))
+        _WARM_TASKS.add(task)
+        task.add_done_callback(_WARM_TASKS.discard)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._closed:
+            raise RuntimeError("Cannot send a request, as the client has been closed.")
+        return _shared_async_client()
 
     async def __aenter__(self) -> "AsyncAPIClient":
         return self
@@ -114,30 +793,64 @@ class AsyncAPIClient(BaseAPIClient):
         await self.close()
 
     async def close(self) -> None:
-        if not self._closed:
-            await self.client.aclose()
+        """
+        Close the client, it refuses to send requests afterwards. The shared connection
+        pool stays open for the other clients on the event loop and is released
+        together with the loop, or by firedust.async_shutdown(). Closing the
+        process-wide default client does nothing.
+        """
+        if not self._shared:
             self._closed = True
 
     async def get(
         self, url: str, params: Optional[Dict[str, Any]] = None
     ) -> httpx.Response:
-        return await self._request("get", url, params=params)
+        key = self._get_cache_key(url, params)
+        headers = None
+        if key is not None:
+            cached = self._cached(key)
+            if cached is not None:
+                return cached
+            headers = self._revalidation_headers(key)
+        response = await self._request("get", url, params=params, headers=headers)
+        stored = self._store(key, response)
+        if stored is None:
+            # Nothing left to revalidate, fetch the full response instead
+            response = await self._request("get", url, params=params)
+            stored = self._store(key, response)
+        return response if stored is None else stored
 
     async def post(
-        self, url: str, data: Optional[Dict[str, Any]] = None
+        self,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        idempotent: bool = False,
     ) -> httpx.Response:
-        return await self._request("post", url, data=data)
+        """
+        Send a POST request to the API asynchronously. Pass idempotent=True for
+        read-only requests, they are retried on transient failures like GET requests.
+        """
+        return await self._request(
+            "post", url, data=data, content=content, idempotent=idempotent
+        )
 
     async def put(
-        self, url: str, data: Optional[Dict[str, Any]] = None
+        self,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
     ) -> httpx.Response:
-        return await self._request("put", url, data=data)
+        return await self._request("put", url, data=data, content=content)
 
     async def patch(
-        self, url: str, data: Optional[Dict[str, Any]] = None
+        self,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
     ) -> httpx.Response:
         """Send a JSON *PATCH* request to the API asynchronously."""
-        return await self._request("patch", url, data=data)
+        return await self._request("patch", url, data=data, content=content)
 
     async def delete(
         self, url: str, params: Optional[Dict[str, Any]] = None
@@ -145,19 +858,43 @@ class AsyncAPIClient(BaseAPIClient):
         return await self._request("delete", url, params=params)
 
     async def get_stream(
-        self, url: str, params: Optional[Dict[str, Any]] = None
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        chunk_size: Optional[int] = None,
     ) -> AsyncIterator[bytes]:
+        """
+        Yields the response body as it arrives. By default every network read is
+        yielded right away, which gives the lowest latency to the first event. Set
+        `chunk_size` to coalesce reads into fewer, larger chunks for bulk transfers.
+        """
         url = self.base_url + url
-        async with self.client.stream("get", url, params=params) as response:
-            async for chunk in response.aiter_bytes():
+        async with self.client.stream(
+            "get", url, params=params, headers=self.headers
+        ) as response:
+            async for chunk in response.aiter_bytes(chunk_size):
                 yield chunk
 
     async def post_stream(
-        self, url: str, data: Optional[Dict[str, Any]] = None
+        self,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        chunk_size: Optional[int] = None,
+        content: Optional[bytes] = None,
     ) -> AsyncIterator[bytes]:
+        """
+        Yields the response body as it arrives. By default every network read is
+        yielded right away, which gives the lowest latency to the first event. Set
+        `chunk_size` to coalesce reads into fewer, larger chunks for bulk transfers.
+        The body is either a `data` payload or an already serialized JSON `content`.
+        """
+        if content is None:
+            content = _encode(data)
         url = self.base_url + url
-        async with self.client.stream("post", url, json=data) as response:
-            async for chunk in response.aiter_bytes():
+        async with self.client.stream(
+            "post", url, content=content, headers=self.headers
+        ) as response:
+            async for chunk in response.aiter_bytes(chunk_size):
                 yield chunk
 
     async def _request(
@@ -166,7 +903,107 @@ class AsyncAPIClient(BaseAPIClient):
         url: str,
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        idempotent: bool = False,
+        headers: Optional[Dict[str, str]] = None,
     ) -> httpx.Response:
+        """
+        Send a request to the API. The body is either a `data` payload, encoded as
+        JSON here, or an already serialized JSON `content` (see `json_body`).
+        GET and idempotent requests are retried on transient failures, other writes
+        only on connection failures.
+        """
+        if content is None:
+            content = _encode(data)
         url = self.base_url + url
-        response = await self.client.request(method, url, params=params, json=data)
+        breaker = _breaker(self.base_url)
+        probe = breaker is not None and breaker.check()
+
+        request_headers = self.headers
+        if headers is not None:
+            request_headers = self.headers.copy()
+            request_headers.update(headers)
+
+        def send() -> Awaitable[httpx.Response]:
+            return self.client.request(
+                method, url, params=params, content=content, headers=request_headers
+            )
+
+        try:
+            if _RETRY:
+                response = await async_with_retry(
+                    send, connect_only=not (idempotent or method in SAFE_METHODS)
+                )
+            else:
+                response = await send()
+        except httpx.TransportError:
+            if breaker is not None:
+                breaker.record(success=False)
+            raise
+        else:
+            if breaker is not None:
+                breaker.record(success=response.status_code < 500)
+        finally:
+            if breaker is not None and probe:
+                breaker.release()
+        self._written(method, idempotent, response)
         return response
+
+
+_DEFAULT_SYNC_CLIENT: Optional[SyncAPIClient] = None
+_DEFAULT_ASYNC_CLIENT: Optional[AsyncAPIClient] = None
+_DEFAULT_CLIENT_LOCK = threading.Lock()
+
+
+def default_sync_client() -> SyncAPIClient:
+    """
+    Return the process-wide SyncAPIClient, creating it on first use. Reusing it keeps
+    the HTTP connections alive between calls instead of reconnecting every time.
+    """
+    global _DEFAULT_SYNC_CLIENT
+    if _DEFAULT_SYNC_CLIENT is None:
+        with _DEFAULT_CLIENT_LOCK:
+            if _DEFAULT_SYNC_CLIENT is None:
+                _DEFAULT_SYNC_CLIENT = SyncAPIClient()
+                _DEFAULT_SYNC_CLIENT._shared = True
+    return _DEFAULT_SYNC_CLIENT
+
+
+def default_async_client() -> AsyncAPIClient:
+    """
+    Return the process-wide AsyncAPIClient, creating it on first use. It is safe to
+    share across event loops, the connection pool is picked per running loop.
+    """
+    global _DEFAULT_ASYNC_CLIENT
+    if _DEFAULT_ASYNC_CLIENT is None:
+        with _DEFAULT_CLIENT_LOCK:
+            if _DEFAULT_ASYNC_CLIENT is None:
+                _DEFAULT_ASYNC_CLIENT = AsyncAPIClient()
+                _DEFAULT_ASYNC_CLIENT._shared = True
+    return _DEFAULT_ASYNC_CLIENT
+
+
+def shutdown() -> None:
+    """
+    Release the connections of the shared default sync client. It reconnects on the
+    next call that needs it, including calls of assistants loaded before. Useful for
+    explicit teardown, e.g. in tests or before forking.
+    """
+    client = _DEFAULT_SYNC_CLIENT
+    if client is not None:
+        client._client.close()
+
+
+# Release the default client's sockets cleanly when the interpreter exits
+atexit.register(shutdown)
+
+
+async def async_shutdown() -> None:
+    """
+    Close the shared async connection pool of the running event loop. A new pool is
+    created on the next async call that needs one, including calls of assistants
+    loaded before.
+    """
+    client = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
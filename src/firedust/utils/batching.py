@@ -0,0 +1,89 @@
+import asyncio
+import weakref
+from typing import Awaitable, Callable, Generic, List, Set, Tuple, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_Pending = List[Tuple[K, "asyncio.Future[V]"]]
+
+
+class MicroBatcher(Generic[K, V]):
+    """
+    Coalesces concurrent async calls into batches. Items submitted within
+    `window_ms` of the first pending item, or until `max_batch` items are
+    waiting, are passed to `flush` in one call and the results are fanned
+    back out to the callers. Pending items are tracked per event loop.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[K]], Awaitable[List[V]]],
+        window_ms: float = 5,
+        max_batch: int = 64,
+    ) -> None:
+        self._flush = flush
+        self.configure(window_ms, max_batch)
+        self._pending: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Pending[K, V]]"
+        ) = weakref.WeakKeyDictionary()
+        self._timers: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.TimerHandle]"
+        ) = weakref.WeakKeyDictionary()
+        self._tasks: "Set[asyncio.Task[None]]" = set()
+
+    def configure(self, window_ms: float, max_batch: int) -> None:
+        if window_ms < 0:
+            raise ValueError("window_ms must be a non-negative number.")
+        if max_batch < 1:
+            raise ValueError("max_batch must be a positive integer.")
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+
+    async def submit(self, item: K) -> V:
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[V]" = loop.create_future()
+        pending = self._pending.setdefault(loop, [])
+        pending.append((item, future))
+        if len(pending) >= self.max_batch:
+            self._dispatch(loop)
+        elif len(pending) == 1:
+            self._timers[loop] = loop.call_later(self.window, self._dispatch, loop)
+        return await future
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        timer = self._timers.pop(loop, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(loop, [])
+        if batch:
+            task = loop.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: "_Pending[K, V]") -> None:
+        try:
+            results = await self._flush([item for item, _ in batch])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if len(results) != len(batch):
+            # Results are matched to callers by position, which is lost on a mismatch
+            error = RuntimeError(
+                f"Batch returned {len(results)} results for {len(batch)} items."
+            )
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
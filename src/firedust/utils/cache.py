@@ -0,0 +1,226 @@
+import hashlib
+import math
+import operator
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+V = TypeVar("V")
+
+
+def content_key(content: str) -> str:
+    """
+    Returns a short, fixed size cache key for the given text.
+    """
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+class LRUCache(Generic[V]):
+    """
+    A bounded, thread-safe, least-recently-used cache. With a `ttl`, entries expire
+    that many seconds after they were set.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be a non-negative integer.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be a positive number.")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if self._ttl is not None and entry[0] <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: V) -> None:
+        if self._maxsize == 0:
+            return
+        expires_at = math.inf if self._ttl is None else time.monotonic() + self._ttl
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def keys(self) -> List[Hashable]:
+        with self._lock:
+            return list(self._data)
+
+    def pop(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return None if entry is None else entry[1]
+
+    def resize(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be a non-negative integer.")
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._data) > maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+try:  # numpy is optional, it makes the similarity scan of SemanticCache vectorized
+    import numpy as np
+
+    def _normalize(vector: Sequence[float]) -> Sequence[float]:
+        array = np.asarray(vector, dtype=np.float64)
+        norm = float(np.linalg.norm(array))
+        return cast(Sequence[float], array if norm == 0 else array / norm)
+
+    def _most_similar(
+        query: Sequence[float], vectors: List[Sequence[float]], threshold: float
+    ) -> Optional[int]:
+        """
+        Returns the index of the vector most similar to the query, the latest one on
+        ties, or None if no similarity reaches the threshold.
+        """
+        if not vectors:
+            return None
+        similarities = np.stack(vectors) @ np.asarray(query)
+        best = len(vectors) - 1 - int(np.argmax(similarities[::-1]))
+        return best if float(similarities[best]) >= threshold else None
+
+except ImportError:
+
+    def _normalize(vector: Sequence[float]) -> Sequence[float]:
+        norm = math.sqrt(sum(map(operator.mul, vector, vector)))
+        if norm == 0:
+            return list(vector)
+        return [value / norm for value in vector]
+
+    def _most_similar(
+        query: Sequence[float], vectors: List[Sequence[float]], threshold: float
+    ) -> Optional[int]:
+        """
+        Returns the index of the vector most similar to the query, the latest one on
+        ties, or None if no similarity reaches the threshold.
+        """
+        best, best_similarity = None, threshold
+        for index, vector in enumerate(vectors):
+            similarity = sum(map(operator.mul, query, vector))
+            if similarity >= best_similarity:
+                best, best_similarity = index, similarity
+        return best
+
+
+class SemanticCache(Generic[V]):
+    """
+    A bounded, thread-safe cache keyed by text embeddings. A lookup hits the most
+    similar entry of the same namespace if its cosine similarity with the query
+    embedding is at least `threshold` and the entry is younger than `ttl` seconds.
+    The lookup compares the query with every entry of the namespace, with numpy when
+    it is installed, and without holding the lock.
+    """
+
+    def __init__(
+        self, threshold: float = 0.85, max_entries: int = 1024, ttl: float = 3600
+    ) -> None:
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in the (0, 1] range.")
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer.")
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._size = 0
+        self._namespaces: Dict[
+            Hashable, "OrderedDict[int, Tuple[Sequence[float], V, float]]"
+        ] = {}
+        self._next_key = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get(
+        self, embedding: Sequence[float], namespace: Hashable = None
+    ) -> Optional[V]:
+        query = _normalize(embedding)
+        now = time.monotonic()
+        with self._lock:
+            entries = self._namespaces.get(namespace)
+            if not entries:
+                return None
+            for key in [key for key, entry in entries.items() if entry[2] <= now]:
+                del entries[key]
+                self._size -= 1
+            candidates = list(entries.items())
+
+        best = _most_similar(
+            query, [entry[0] for _, entry in candidates], self.threshold
+        )
+        if best is None:
+            return None
+        best_key, entry = candidates[best]
+        with self._lock:
+            # Re-key on access, so keys stay ordered by recency across namespaces
+            if entries.pop(best_key, None) is not None:
+                entries[self._next_key] = entry
+                self._next_key += 1
+        return entry[1]
+
+    def set(
+        self, embedding: Sequence[float], value: V, namespace: Hashable = None
+    ) -> None:
+        with self._lock:
+            entries = self._namespaces.setdefault(namespace, OrderedDict())
+            entries[self._next_key] = (
+                _normalize(embedding),
+                value,
+                time.monotonic() + self.ttl,
+            )
+            self._next_key += 1
+            self._size += 1
+            while self._size > self.max_entries:
+                self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        # The least recently used entry is the lowest key among the namespaces' heads
+        oldest_namespace, oldest_key = None, None
+        for namespace, entries in self._namespaces.items():
+            if entries:
+                key = next(iter(entries))
+                if oldest_key is None or key < oldest_key:
+                    oldest_namespace, oldest_key = namespace, key
+        if oldest_key is None:
+            return
+        del self._namespaces[oldest_namespace][oldest_key]
+        self._size -= 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._namespaces.clear()
+            self._size = 0
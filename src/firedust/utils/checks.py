@@ -20,3 +20,23 @@ def is_unix_timestamp(timestamp: Union[int, float]) -> bool:
     MIN_UNIX_TIMESTAMP = 0  # 1 January 1970
     MAX_UNIX_TIMESTAMP = 2**31 - 1  # 19 January 2038 for a 32-bit signed integer
     return MIN_UNIX_TIMESTAMP <= timestamp <= MAX_UNIX_TIMESTAMP
+
+
+def to_seconds(timestamp: Union[int, float]) -> float:
+    """
+    Convert a UNIX timestamp in seconds, milliseconds or microseconds to seconds.
+
+    Args:
+        timestamp (Union[int, float]): The timestamp, in any of the units above.
+
+    Returns:
+        float: The timestamp in seconds.
+    """
+    # µs (≥ 1e14) → seconds
+    if timestamp > 1e14:
+        return timestamp / 1_000_000
+    # ms (≥ 1e11) → seconds
+    if timestamp > 1e11:
+        return timestamp / 1_000
+    # Already seconds
+    return float(timestamp)
@@ -2,6 +2,10 @@
 This module contains custom errors used in the Firedust SDK.
 """
 
+from typing import Optional
+
+import httpx
+
 
 # AUTHENTICATION ERRORS
 class MissingFiredustKeyError(Exception):
@@ -15,13 +19,35 @@ class MissingFiredustKeyError(Exception):
 
 # API ERRORS
 class APIError(Exception):
-    def __init__(self, message: str, code: int) -> None:
+    """
+    Raised when the Firedust API returns an unsuccessful response. If the response
+    is provided, its body is appended to the message only when the message is read
+    or the error is rendered. The rendered message is built once and reused, e.g. by
+    log handlers and tracebacks.
+    """
+
+    def __init__(
+        self, message: str, code: int, response: Optional[httpx.Response] = None
+    ) -> None:
         self.code = code
-        self.message = message
+        self.response = response
+        self._message = message
+        self._rendered: Optional[str] = None
         super().__init__(message)
 
+    @property
+    def message(self) -> str:
+        """
+        The error message, followed by the response body if a response is provided.
+        """
+        if self.response is None:
+            return self._message
+        return f"{self._message}: {self.response.text}"
+
     def __str__(self) -> str:
-        return f"APIError (code={self.code}): {super().__str__()}"
+        if self._rendered is None:
+            self._rendered = f"APIError (code={self.code}): {self.message}"
+        return self._rendered
 
 
 # ASSISTANT ERRORS
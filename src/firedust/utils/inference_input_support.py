@@ -1,4 +1,4 @@
-from typing import Dict, Iterable, Set, Union
+from typing import Dict, FrozenSet, Iterable, Set, Union
 
 from firedust.types.base import INFERENCE_MODEL
 
@@ -12,32 +12,34 @@ from firedust.types.base import INFERENCE_MODEL
 # • "file" – inline PDF file input (data-URI) for retrieval-augmented context.
 # -----------------------------------------------------------------------------
 
-_MODEL_CONTENT_SUPPORT: Dict[INFERENCE_MODEL, Set[str]] = {
+_NO_EXTRA_CONTENT: FrozenSet[str] = frozenset()
+
+_MODEL_CONTENT_SUPPORT: Dict[INFERENCE_MODEL, FrozenSet[str]] = {
     # OpenAI ----------------------------------------------------------
-    "openai/gpt-4o": {"image_url", "file"},
-    "openai/gpt-4o-mini": {"image_url", "file"},
+    "openai/gpt-4o": frozenset({"image_url", "file"}),
+    "openai/gpt-4o-mini": frozenset({"image_url", "file"}),
     # GPT-4.1 (preview) – text & vision image inputs (per 2025-05 docs)
-    "openai/gpt-4.1": {"image_url", "file"},
+    "openai/gpt-4.1": frozenset({"image_url", "file"}),
     # o3 and gpt-5 models support vision (images) and files but NOT raw audio (use separate transcribe models)
-    "openai/o3-mini": {"image_url", "file"},
-    "openai/o3": {"image_url", "file"},
-    "openai/o4-mini": {"image_url", "file"},
-    "openai/gpt-5": {"image_url", "file"},
-    "openai/gpt-5-mini": {"image_url", "file"},
+    "openai/o3-mini": frozenset({"image_url", "file"}),
+    "openai/o3": frozenset({"image_url", "file"}),
+    "openai/o4-mini": frozenset({"image_url", "file"}),
+    "openai/gpt-5": frozenset({"image_url", "file"}),
+    "openai/gpt-5-mini": frozenset({"image_url", "file"}),
     # Mistral ---------------------------------------------------------
-    "mistral/mistral-medium": set(),
-    "mistral/mistral-small": set(),
+    "mistral/mistral-medium": frozenset(),
+    "mistral/mistral-small": frozenset(),
     # Groq (open-source models) --------------------------------------
-    "groq/llama-3.3-70b-versatile": set(),
-    "groq/llama-3.1-8b-instant": set(),
+    "groq/llama-3.3-70b-versatile": frozenset(),
+    "groq/llama-3.1-8b-instant": frozenset(),
 }
 
 
-def supported_content_types(model: INFERENCE_MODEL) -> Set[str]:
+def supported_content_types(model: INFERENCE_MODEL) -> FrozenSet[str]:
     """Return the set of *extra* content types (excluding plain text) supported
     by *model*.
     """
-    return _MODEL_CONTENT_SUPPORT.get(model, set())
+    return _MODEL_CONTENT_SUPPORT.get(model, _NO_EXTRA_CONTENT)
 
 
 def validate_message_content(
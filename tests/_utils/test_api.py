@@ -0,0 +1,319 @@
+import asyncio
+import json
+import threading
+from datetime import date, datetime
+from typing import List, Optional
+from uuid import UUID
+
+import httpx
+import pytest
+
+from firedust.types import MemoryItem
+from firedust.utils import api
+from firedust.utils.api import (
+    AsyncAPIClient,
+    CircuitBreaker,
+    SyncAPIClient,
+    configure,
+    default_async_client,
+    dump_models,
+    dumps,
+    json_body,
+    loads,
+    with_retry,
+)
+from firedust.utils.errors import APIError
+
+
+def test_with_retry_recovers_from_transient_errors() -> None:
+    statuses: List[int] = [503, 429, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0), headers={"Retry-After": "0"})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    response = with_retry(lambda: client.get("https://api.firedust.dev/assistant"))
+    assert response.status_code == 200
+    assert statuses == []
+
+
+def test_with_retry_does_not_retry_client_errors() -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(404)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    response = with_retry(lambda: client.get("https://api.firedust.dev/assistant"))
+    assert response.status_code == 404
+    assert len(calls) == 1
+
+
+def test_json_body_splices_serialized_models() -> None:
+    memories = [
+        MemoryItem(assistant="sample", content="First memory.", timestamp=1700000000),
+        MemoryItem(assistant="sample", content="Ünïcode memory.", timestamp=1700000001),
+    ]
+    body = json_body({"assistant": "sample"}, memories=dump_models(memories))
+    assert json.loads(body) == {
+        "assistant": "sample",
+        "memories": [json.loads(memory.model_dump_json()) for memory in memories],
+    }
+    assert json.loads(json_body({}, memories=dump_models([]))) == {"memories": []}
+
+
+def test_dumps_serializes_uuids_compactly() -> None:
+    memory_id = UUID(int=1)
+    assert dumps({"memory_ids": [memory_id]}) == (
+        b'{"memory_ids":["00000000-0000-0000-0000-000000000001"]}'
+    )
+    assert loads(dumps({"content": "Ünïcode"})) == {"content": "Ünïcode"}
+
+
+def test_dumps_matches_across_json_backends() -> None:
+    pytest.importorskip("orjson")
+    payload = {
+        "memory_ids": [UUID(int=1)],
+        "timestamp": datetime(2024, 1, 1, 12, 30, 15, 250),
+        "day": date(2024, 1, 1),
+        "content": "Ünïcode",
+        "values": [1, 2.5, None, True],
+    }
+    assert dumps(payload) == api._stdlib_dumps(payload)
+    assert loads(dumps(payload))["timestamp"] == "2024-01-01T12:30:15.000250"
+
+
+def test_dumps_rejects_values_json_has_no_type_for() -> None:
+    for encode in (dumps, api._stdlib_dumps):
+        with pytest.raises(TypeError):
+            encode({"tags": {"a", "b"}})
+
+
+def test_with_retry_recovers_from_connection_errors() -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    response = with_retry(lambda: client.get("https://api.firedust.dev/assistant"))
+    assert response.status_code == 200
+    assert len(calls) == 2
+
+
+def test_circuit_breaker_fails_fast_after_consecutive_failures() -> None:
+    breaker = CircuitBreaker(threshold=2, cooldown=60)
+    breaker.check()
+    breaker.record(success=False)
+    breaker.check()
+    breaker.record(success=False)
+    with pytest.raises(APIError) as error:
+        breaker.check()
+    assert error.value.code == 503
+
+    breaker.record(success=True)
+    breaker.check()
+
+
+def test_writes_are_only_retried_on_connection_errors() -> None:
+    calls: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if request.method == "PUT":
+            raise httpx.ReadTimeout("timed out", request=request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(503)
+
+    api_client = SyncAPIClient(api_key="key", base_url="https://writes.firedust.dev")
+    api_client.client = httpx.Client(
+        base_url=api_client.base_url, transport=httpx.MockTransport(handler)
+    )
+    assert api_client.delete("/assistant").status_code == 503
+    assert calls == ["DELETE", "DELETE"]
+
+    with pytest.raises(httpx.ReadTimeout):
+        api_client.put("/assistant/memory/list", data={"memories": []})
+    assert calls == ["DELETE", "DELETE", "PUT"]
+
+
+def test_half_open_circuit_lets_a_single_probe_through(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    base_url = "https://breaker.firedust.dev"
+    monkeypatch.setattr(api, "_RETRY", False)
+    monkeypatch.setitem(
+        api._BREAKERS, base_url, CircuitBreaker(threshold=1, cooldown=0)
+    )
+    probing, release = threading.Event(), threading.Event()
+    statuses: List[int] = [503]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if not statuses:
+            probing.set()
+            release.wait(5)
+            return httpx.Response(200)
+        return httpx.Response(statuses.pop())
+
+    api_client = SyncAPIClient(api_key="key", base_url=base_url)
+    api_client.client = httpx.Client(
+        base_url=base_url, transport=httpx.MockTransport(handler)
+    )
+    assert api_client.get("/assistant").status_code == 503
+
+    responses: List[httpx.Response] = []
+    probe = threading.Thread(target=lambda: responses.append(api_client.get("/a")))
+    probe.start()
+    assert probing.wait(5)
+    with pytest.raises(APIError) as error:
+        api_client.get("/assistant")
+    assert error.value.code == 503
+
+    release.set()
+    probe.join(5)
+    assert responses[0].status_code == 200
+    assert api_client.get("/assistant").status_code == 200
+
+
+def test_rate_limits_do_not_open_the_circuit(monkeypatch: pytest.MonkeyPatch) -> None:
+    base_url = "https://limits.firedust.dev"
+    monkeypatch.setattr(api, "_RETRY", False)
+    monkeypatch.setitem(api._BREAKERS, base_url, CircuitBreaker(threshold=2))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": "7"})
+
+    api_client = SyncAPIClient(api_key="key", base_url=base_url)
+    api_client.client = httpx.Client(
+        base_url=base_url, transport=httpx.MockTransport(handler)
+    )
+    for _ in range(5):
+        response = api_client.get("/assistant")
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "7"
+
+
+def test_circuit_breaker_can_be_turned_off(monkeypatch: pytest.MonkeyPatch) -> None:
+    base_url = "https://unbroken.firedust.dev"
+    monkeypatch.setattr(api, "_RETRY", False)
+    monkeypatch.setattr(api, "_BREAKER", True)
+    monkeypatch.setitem(api._BREAKERS, base_url, CircuitBreaker(threshold=1))
+    api.configure(circuit_breaker=False)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(502)
+
+    api_client = SyncAPIClient(api_key="key", base_url=base_url)
+    api_client.client = httpx.Client(
+        base_url=base_url, transport=httpx.MockTransport(handler)
+    )
+    for _ in range(3):
+        assert api_client.get("/assistant").status_code == 502
+
+
+def test_post_stream_coalesces_chunks() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=iter([b"ab", b"cd", b"e"]))
+
+    api_client = SyncAPIClient(api_key="key", base_url="https://api.firedust.dev")
+    api_client.client = httpx.Client(
+        base_url=api_client.base_url, transport=httpx.MockTransport(handler)
+    )
+    assert list(api_client.post_stream("/chat", chunk_size=4)) == [b"abcd", b"e"]
+
+
+def test_get_cache_reuses_responses_until_a_write() -> None:
+    calls: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(200, json={"data": len(calls)})
+
+    api_client = SyncAPIClient(
+        api_key="key", base_url="https://api.firedust.dev", cache_ttl=60
+    )
+    api_client.client = httpx.Client(
+        base_url=api_client.base_url, transport=httpx.MockTransport(handler)
+    )
+    first = api_client.get("/assistant", params={"name": "sam"})
+    assert api_client.get("/assistant", params={"name": "sam"}) is first
+    assert api_client.get("/assistant", params={"name": "frodo"}) is not first
+
+    api_client.invalidate("/assistant/list")
+    assert api_client.get("/assistant", params={"name": "sam"}) is first
+    api_client.patch("/assistant", data={"assistant": "sam"})
+    assert api_client.get("/assistant", params={"name": "sam"}) is not first
+    assert calls == ["GET", "GET", "PATCH", "GET"]
+
+
+def test_get_cache_revalidates_expired_responses_with_etag() -> None:
+    sent: List[Optional[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"data": []}, headers={"ETag": '"v1"'})
+
+    api_client = SyncAPIClient(
+        api_key="key", base_url="https://api.firedust.dev", cache_ttl=60
+    )
+    api_client.client = httpx.Client(
+        base_url=api_client.base_url, transport=httpx.MockTransport(handler)
+    )
+    first = api_client.get("/assistant/list")
+    api_client.cache_ttl = 1e-9
+    assert api_client.get("/assistant/list") is first
+    assert sent == [None, '"v1"']
+
+
+def test_get_cache_refetches_when_the_revalidated_response_is_gone() -> None:
+    sent: List[Optional[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            # The entry is dropped while the revalidation is in flight
+            api_client.invalidate()
+            return httpx.Response(304)
+        return httpx.Response(200, json={"data": []}, headers={"ETag": '"v1"'})
+
+    api_client = SyncAPIClient(
+        api_key="key", base_url="https://api.firedust.dev", cache_ttl=1e-9
+    )
+    api_client.client = httpx.Client(
+        base_url=api_client.base_url, transport=httpx.MockTransport(handler)
+    )
+    api_client.get("/assistant/list")
+    assert api_client.get("/assistant/list").status_code == 200
+    assert sent == [None, '"v1"', None]
+
+
+@pytest.mark.asyncio
+async def test_closed_async_client_refuses_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    api_client = AsyncAPIClient(api_key="key", base_url="https://closed.firedust.dev")
+    await api_client.close()
+    with pytest.raises(RuntimeError):
+        await api_client.get("/assistant")
+
+    # The default client is shared by every assistant, closing it does nothing
+    monkeypatch.setenv("FIREDUST_API_KEY", "key")
+    monkeypatch.setattr(api, "_DEFAULT_ASYNC_CLIENT", None)
+    await default_async_client().close()
+    assert default_async_client().client is not None
+
+
+@pytest.mark.asyncio
+async def test_configure_closes_the_replaced_async_pools() -> None:
+    pool = AsyncAPIClient(api_key="key").client
+    configure(http2=False)
+    await asyncio.sleep(0.01)
+    assert pool.is_closed
+    assert AsyncAPIClient(api_key="key").client is not pool
@@ -0,0 +1,43 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from firedust.utils.batching import MicroBatcher
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_coalesces_concurrent_calls() -> None:
+    batches: List[List[int]] = []
+
+    async def flush(items: List[int]) -> List[int]:
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    batcher: MicroBatcher[int, int] = MicroBatcher(flush, window_ms=5, max_batch=3)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+    assert results == [0, 2, 4, 6, 8]
+    assert batches == [[0, 1, 2], [3, 4]]
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_propagates_errors() -> None:
+    async def flush(items: List[int]) -> List[int]:
+        raise RuntimeError("boom")
+
+    batcher: MicroBatcher[int, int] = MicroBatcher(flush)
+    with pytest.raises(RuntimeError):
+        await batcher.submit(1)
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_fails_callers_on_missing_results() -> None:
+    async def flush(items: List[int]) -> List[int]:
+        return items[:-1]
+
+    batcher: MicroBatcher[int, int] = MicroBatcher(flush, window_ms=5)
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True),
+        timeout=1,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
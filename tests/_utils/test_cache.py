@@ -0,0 +1,48 @@
+import time
+
+from firedust.utils.cache import LRUCache, SemanticCache, content_key
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    cache: LRUCache[int] = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    cache.resize(1)
+    assert len(cache) == 1
+    assert cache.get("c") == 3
+
+
+def test_lru_cache_expires_entries_after_ttl() -> None:
+    cache: LRUCache[int] = LRUCache(maxsize=2, ttl=0.01)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_content_key_is_stable() -> None:
+    assert content_key("hello") == content_key("hello")
+    assert content_key("hello") != content_key("hello!")
+    assert len(content_key("hello")) == 32
+
+
+def test_semantic_cache_hits_similar_embeddings() -> None:
+    cache: SemanticCache[str] = SemanticCache(threshold=0.9, max_entries=2)
+    cache.set([1.0, 0.0], "late deliveries", namespace=10)
+    assert cache.get([0.99, 0.05], namespace=10) == "late deliveries"
+    assert cache.get([0.0, 1.0], namespace=10) is None
+    assert cache.get([1.0, 0.0], namespace=20) is None
+
+    cache.set([0.0, 1.0], "refunds", namespace=10)
+    cache.get([1.0, 0.0], namespace=10)
+    cache.set([0.7, 0.7], "other", namespace=20)
+    assert len(cache) == 2
+    assert cache.get([0.0, 1.0], namespace=10) is None
+    assert cache.get([1.0, 0.0], namespace=10) == "late deliveries"
@@ -1,4 +1,4 @@
-from firedust.utils.checks import is_unix_timestamp
+from firedust.utils.checks import is_unix_timestamp, to_seconds
 
 
 def test_is_unix_timestamp() -> None:
@@ -12,3 +12,9 @@ def test_is_unix_timestamp() -> None:
 
     # After 2038
     assert is_unix_timestamp(2**31) is False
+
+
+def test_to_seconds() -> None:
+    assert to_seconds(1700000000) == 1700000000.0
+    assert to_seconds(1700000000000) == 1700000000.0
+    assert to_seconds(1700000000000000) == 1700000000.0
@@ -0,0 +1,18 @@
+import httpx
+
+from firedust.utils.errors import APIError
+
+
+def test_api_error_message() -> None:
+    error = APIError(message="Failed to recall memories", code=500)
+    assert str(error) == "APIError (code=500): Failed to recall memories"
+
+
+def test_api_error_includes_response_body() -> None:
+    response = httpx.Response(404, text="Assistant not found")
+    error = APIError(message="Failed to recall memories", code=404, response=response)
+    assert error.response is response
+    assert error.message == "Failed to recall memories: Assistant not found"
+    assert str(error) == (
+        "APIError (code=404): Failed to recall memories: Assistant not found"
+    )
@@ -0,0 +1,54 @@
+import asyncio
+from typing import Callable, Iterator
+
+import httpx
+import pytest
+
+from firedust.utils import api
+from firedust.utils.api import AsyncAPIClient, SyncAPIClient
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+BASE_URL = "https://mock.firedust.dev"
+
+
+class MockAPI:
+    """
+    API clients whose requests are answered by `handler` instead of the Firedust API.
+    Async requests wait `latency` seconds before they are answered.
+    """
+
+    def __init__(self) -> None:
+        self.handler: Handler = lambda request: httpx.Response(404)
+        self.latency = 0.0
+        self.sync_client = SyncAPIClient(api_key="key", base_url=BASE_URL)
+        self.sync_client.client = httpx.Client(
+            base_url=BASE_URL, transport=httpx.MockTransport(self._handle)
+        )
+        self.async_client = AsyncAPIClient(api_key="key", base_url=BASE_URL)
+        self.async_pool = httpx.AsyncClient(
+            transport=httpx.MockTransport(self._handle_async)
+        )
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        return self.handler(request)
+
+    async def _handle_async(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self.latency)
+        return self.handler(request)
+
+
+@pytest.fixture
+def mock_api(monkeypatch: pytest.MonkeyPatch) -> Iterator[MockAPI]:
+    """
+    Route the requests of the sync and async clients to a handler. The async
+    connection pools, the default clients and the circuit breakers are patched for
+    the test only, and restored afterwards.
+    """
+    mock = MockAPI()
+    monkeypatch.setattr(api, "_shared_async_client", lambda: mock.async_pool)
+    monkeypatch.setattr(api, "_DEFAULT_SYNC_CLIENT", None)
+    monkeypatch.setattr(api, "_DEFAULT_ASYNC_CLIENT", None)
+    monkeypatch.setattr(api, "_BREAKERS", {})
+    yield mock
+    mock.sync_client.close()
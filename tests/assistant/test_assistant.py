@@ -1,11 +1,15 @@
 import os
 import random
+from typing import List
 
+import httpx
 import pytest
+from pydantic import ValidationError
 
 import firedust
-from firedust.types import Assistant, AsyncAssistant
+from firedust.types import Assistant, AssistantConfig, AsyncAssistant
 from firedust.types.base import INFERENCE_MODEL
+from firedust.utils import api
 from firedust.utils.errors import APIError
 
 
@@ -175,3 +179,42 @@ async def test_async_load_non_existing_assistant() -> None:
         assert "Assistant not found." in e.message
     except Exception as e:
         assert False, f"Unexpected exception: {e}"
+
+
+def test_assistant_config_rejects_empty_name() -> None:
+    with pytest.raises(ValidationError) as excinfo:
+        AssistantConfig(name="", instructions="Help.")
+    (error,) = excinfo.value.errors()
+    assert error["loc"] == ("name",)
+    assert error["type"] == "string_too_short"
+    assert error["msg"] == "String should have at least 1 character"
+
+
+def test_assistant_works_after_shutdown(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(200, json={"status": "success", "data": None})
+
+    monkeypatch.setenv("FIREDUST_API_KEY", "key")
+    monkeypatch.setattr(api, "_DEFAULT_SYNC_CLIENT", None)
+    api_client = api.default_sync_client()
+    monkeypatch.setattr(
+        api_client,
+        "_connect",
+        lambda: httpx.Client(
+            base_url=api_client.base_url, transport=httpx.MockTransport(handler)
+        ),
+    )
+    api_client.client = api_client._connect()
+    assistant = Assistant._create_instance(
+        AssistantConfig(name="sam", instructions="Help."), api_client
+    )
+
+    assistant.update.instructions("Help politely.")
+    connection = api_client.client
+    firedust.shutdown()
+    assert connection.is_closed
+    assistant.update.instructions("Help briefly.")
+    assert calls == ["PATCH", "PATCH"]
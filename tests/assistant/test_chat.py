@@ -1,10 +1,16 @@
+import json
 import os
 import random
+from typing import List
 
+import httpx
 import pytest
+from conftest import MockAPI
 
 import firedust
+from firedust._assistant.chat.base import AsyncChat, Chat
 from firedust.types import (
+    AssistantConfig,
     JSONSchema,
     JSONSchemaConfig,
     Message,
@@ -12,6 +18,8 @@ from firedust.types import (
     ReferencedMessage,
     ResponseFormat,
 )
+from firedust.types.chat import AudioContentPart, AudioData, TextContentPart
+from firedust.utils.errors import APIError
 
 
 @pytest.mark.skipif(
@@ -566,3 +574,136 @@ async def test_async_add_get_delete_history() -> None:
         assert len(history) == 0
     finally:
         await assistant.delete(confirm=True)
+
+
+@pytest.fixture
+def chat(mock_api: MockAPI) -> Chat:
+    return Chat(AssistantConfig(name="sam", instructions="Help."), mock_api.sync_client)
+
+
+@pytest.fixture
+def async_chat(mock_api: MockAPI) -> AsyncChat:
+    # a little latency, so that concurrent uploads overlap
+    mock_api.latency = 0.01
+    return AsyncChat(
+        AssistantConfig(name="sam", instructions="Help."), mock_api.async_client
+    )
+
+
+def test_chat_errors_include_the_response_body(mock_api: MockAPI, chat: Chat) -> None:
+    mock_api.handler = lambda request: httpx.Response(404, text="Assistant not found.")
+    with pytest.raises(APIError) as error:
+        chat.erase_history("test", confirm=True)
+    assert error.value.message == "Failed to erase chat history: Assistant not found."
+    assert str(error.value) == f"APIError (code=404): {error.value.message}"
+
+
+def _history(count: int) -> List[Message]:
+    return [
+        Message(assistant="sam", chat_group="test", content=f"{i}", author="user")
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_add_history_uploads_bounded_chunks(
+    mock_api: MockAPI, async_chat: AsyncChat
+) -> None:
+    chunks: List[List[str]] = []
+    in_flight: List[int] = [0, 0]  # current, peak
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        chunks.append([m["content"] for m in json.loads(request.content)["messages"]])
+        return httpx.Response(200, json={"data": {}})
+
+    mock_api.handler = handler
+    original_put = async_chat.api_client.put
+
+    async def put(*args: object, **kwargs: object) -> httpx.Response:
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        try:
+            return await original_put(*args, **kwargs)  # type: ignore[arg-type]
+        finally:
+            in_flight[0] -= 1
+
+    async_chat.api_client.put = put  # type: ignore[method-assign]
+    await async_chat.add_history(iter(_history(5)), chunk_size=2, max_concurrency=2)
+    assert sorted(chunks) == [["0", "1"], ["2", "3"], ["4"]]
+    assert in_flight == [0, 2]
+
+
+@pytest.mark.asyncio
+async def test_async_add_history_reports_rejected_chunks(
+    mock_api: MockAPI, async_chat: AsyncChat
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if b'"2"' in request.content:
+            return httpx.Response(500, text="boom")
+        return httpx.Response(200, json={"data": {}})
+
+    mock_api.handler = handler
+    with pytest.raises(APIError) as error:
+        await async_chat.add_history(_history(5), chunk_size=2)
+    assert error.value.code == 500
+    assert "1 of 3 chunks were rejected: chunk 1: boom" in error.value.message
+
+
+@pytest.mark.asyncio
+async def test_async_add_history_keeps_chunks_sent_before_invalid_message(
+    mock_api: MockAPI, async_chat: AsyncChat
+) -> None:
+    stored: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        stored.append(len(json.loads(request.content)["messages"]))
+        return httpx.Response(200, json={"data": {}})
+
+    mock_api.handler = handler
+    async_chat.config.model = "mistral/mistral-small"
+    audio = AudioContentPart(input_audio=AudioData(data="UklGRg==", format="wav"))
+    messages = _history(2) + [
+        Message(
+            assistant="sam",
+            chat_group="test",
+            content=[TextContentPart(text="Listen to this."), audio],
+            author="user",
+        )
+    ]
+    with pytest.raises(ValueError):
+        await async_chat.add_history(messages, chunk_size=2)
+    assert stored == [2]
+
+
+@pytest.mark.asyncio
+async def test_async_add_history_stops_after_a_connection_error(
+    mock_api: MockAPI, async_chat: AsyncChat
+) -> None:
+    sent: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(len(sent))
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    mock_api.handler = handler
+    with pytest.raises(httpx.ReadTimeout):
+        await async_chat.add_history(_history(6), chunk_size=1, max_concurrency=2)
+    assert len(sent) <= 2
+
+
+@pytest.mark.asyncio
+async def test_async_add_history_stops_after_rejected_credentials(
+    mock_api: MockAPI, async_chat: AsyncChat
+) -> None:
+    sent: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(len(sent))
+        return httpx.Response(401, text="Invalid API key.")
+
+    mock_api.handler = handler
+    with pytest.raises(APIError) as error:
+        await async_chat.add_history(_history(6), chunk_size=1, max_concurrency=1)
+    assert error.value.code == 401
+    assert "the remaining messages were not sent" in error.value.message
+    assert sent == [0]
@@ -1,10 +1,17 @@
+import json
 import os
 import random
+from typing import List
+from uuid import uuid4
 
+import httpx
 import pytest
+from conftest import MockAPI
+from pydantic import ValidationError
 
 import firedust
-from firedust.types import MemoryItem
+from firedust._assistant.memory.base import AsyncMemory, Memory
+from firedust.types import AssistantConfig, MemoryItem
 from firedust.utils.errors import APIError
 
 
@@ -248,3 +255,172 @@ async def test_async_share_memories() -> None:
         # Remove test assistants
         await assistant1.delete(confirm=True)
         await assistant2.delete(confirm=True)
+
+
+def test_memory_item_rejects_invalid_timestamp() -> None:
+    with pytest.raises(ValidationError, match="Invalid timestamp"):
+        MemoryItem(assistant="sample", content="A memory.", timestamp=-1)
+
+
+def test_memory_item_normalizes_millisecond_timestamps() -> None:
+    for timestamp in (1700000000, 1700000000000, 1700000000000000):
+        memory = MemoryItem(
+            assistant="sample", content="A memory.", timestamp=timestamp
+        )
+        assert memory.timestamp == 1700000000.0
+
+
+def test_config_id_is_immutable() -> None:
+    memory = MemoryItem(assistant="sample", content="A memory.")
+    with pytest.raises(ValidationError) as error:
+        memory.id = uuid4()
+    assert error.value.errors()[0]["type"] == "frozen_field"
+
+
+@pytest.fixture
+def memory(mock_api: MockAPI) -> Memory:
+    return Memory(
+        AssistantConfig(name="sam", instructions="Help."), mock_api.sync_client
+    )
+
+
+@pytest.fixture
+def async_memory(mock_api: MockAPI) -> AsyncMemory:
+    return AsyncMemory(
+        AssistantConfig(name="sam", instructions="Help."), mock_api.async_client
+    )
+
+
+def test_recall_batch_falls_back_only_when_the_route_is_missing(
+    mock_api: MockAPI, memory: Memory
+) -> None:
+    paths: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("recall_batch"):
+            return httpx.Response(404, json={"detail": "Not Found"})
+        return httpx.Response(200, json={"status": "success", "data": []})
+
+    mock_api.handler = handler
+    assert memory.recall_batch(["a", "b"]) == {0: [], 1: []}
+    assert memory.recall_batch(["c"]) == {0: []}
+    assert paths == [
+        "/assistant/memory/recall_batch",
+        "/assistant/memory/recall",
+        "/assistant/memory/recall",
+        "/assistant/memory/recall",
+    ]
+
+
+def test_recall_batch_raises_on_a_missing_assistant(
+    mock_api: MockAPI, memory: Memory
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            404, json={"status": "error", "message": "Assistant not found."}
+        )
+
+    mock_api.handler = handler
+    with pytest.raises(APIError) as error:
+        memory.recall_batch(["a"])
+    assert error.value.code == 404
+    assert memory.api_client.unsupported_routes == set()
+
+
+def test_get_serves_cached_items_unless_bypassed(
+    mock_api: MockAPI, memory: Memory
+) -> None:
+    item = MemoryItem(assistant="sam", content="Late delivery.", timestamp=1700000000)
+    paths: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"data": [json.loads(item.model_dump_json())]})
+
+    mock_api.handler = handler
+    assert memory.get([item.id]) == [item]
+    assert memory.get([item.id]) == [item]
+    assert memory.get([item.id], no_cache=True) == [item]
+    assert paths == ["/assistant/memory/list", "/assistant/memory/list"]
+
+
+def test_get_accepts_items_stored_after_2038(mock_api: MockAPI, memory: Memory) -> None:
+    memory_id = MemoryItem(assistant="sam", content="x").id
+    timestamp = 2**31 + 5
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        item = {
+            "id": str(memory_id),
+            "assistant": "sam",
+            "content": "Far future.",
+            "timestamp": timestamp,
+        }
+        return httpx.Response(200, json={"data": [item]})
+
+    mock_api.handler = handler
+    (item,) = memory.get([memory_id])
+    assert item.timestamp == timestamp
+
+
+def test_get_is_not_affected_by_mutating_returned_items(
+    mock_api: MockAPI, memory: Memory
+) -> None:
+    item = MemoryItem(assistant="sam", content="Late delivery.", timestamp=1700000000)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"data": [json.loads(item.model_dump_json())]})
+
+    mock_api.handler = handler
+    memory.get([item.id])[0].content = "Changed by the caller."
+    assert memory.get([item.id])[0].content == "Late delivery."
+    memory.get([item.id])[0].content = "Changed again."
+    assert memory.get([item.id])[0].content == "Late delivery."
+
+
+def test_semantic_cache_embeds_with_the_assistant_client(
+    monkeypatch: pytest.MonkeyPatch, mock_api: MockAPI, memory: Memory
+) -> None:
+    paths: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/data/embed/text":
+            return httpx.Response(200, json={"data": {"embedding": [1.0, 0.0]}})
+        return httpx.Response(200, json={"status": "success", "data": []})
+
+    monkeypatch.delenv("FIREDUST_API_KEY", raising=False)
+    mock_api.handler = handler
+    memory.enable_semantic_cache()
+    assert memory.recall("Semantic cache with an explicit key.") == []
+    assert memory.recall("Semantic cache with an explicit key.") == []
+    assert paths == ["/data/embed/text", "/assistant/memory/recall"]
+
+
+def test_semantic_cache_is_not_affected_by_mutating_results(
+    mock_api: MockAPI, memory: Memory
+) -> None:
+    item = MemoryItem(assistant="sam", content="Late delivery.", timestamp=1700000000)
+    paths: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/data/embed/text":
+            return httpx.Response(200, json={"data": {"embedding": [0.0, 1.0]}})
+        return httpx.Response(200, json={"data": [json.loads(item.model_dump_json())]})
+
+    mock_api.handler = handler
+    memory.enable_semantic_cache()
+    memory.recall("Mutated semantic cache results.")[0].content = "Changed."
+    recalled = memory.recall("Mutated semantic cache results.")
+    assert recalled[0].content == "Late delivery."
+    assert paths.count("/assistant/memory/recall") == 1
+
+
+@pytest.mark.asyncio
+async def test_async_get_handles_no_content(
+    mock_api: MockAPI, async_memory: AsyncMemory
+) -> None:
+    mock_api.handler = lambda request: httpx.Response(204)
+    memory_id = MemoryItem(assistant="sam", content="x").id
+    assert await async_memory.get([memory_id]) == []